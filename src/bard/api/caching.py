@@ -0,0 +1,44 @@
+"""HTTP caching helpers for endpoints that serve immutable data.
+
+Chapter metadata, alignment, and agent configuration never change while
+the server is running (they are produced by the offline preprocessing
+pipeline), so their serialized bodies and ETags are computed once and
+cache-warm clients get 304 Not Modified instead of a re-serialized body.
+"""
+
+import hashlib
+from collections.abc import Callable
+
+from fastapi import Request, Response
+
+# cache_key -> (body bytes, etag)
+_responses: dict[str, tuple[bytes, str]] = {}
+
+
+def clear_response_cache() -> None:
+    """Drop all cached bodies (only needed if the underlying data changes)."""
+    _responses.clear()
+
+
+def etag_json_response(
+    request: Request,
+    cache_key: str,
+    build_body: Callable[[], bytes],
+    max_age: int = 3600,
+) -> Response:
+    """Serve a JSON body with a precomputed ETag and long-lived Cache-Control.
+
+    The body is built (and hashed) on first call per cache_key; later calls
+    reuse the bytes and answer If-None-Match with an empty 304.
+    """
+    entry = _responses.get(cache_key)
+    if entry is None:
+        body = build_body()
+        entry = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+        _responses[cache_key] = entry
+    body, etag = entry
+
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}, immutable"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,31 +1,158 @@
 """FastAPI application for Bard audiobook system."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+import httpx
 import uvicorn
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from openai import AsyncOpenAI
+from starlette.middleware.gzip import GZipMiddleware
 
 from bard.api.routes import agent_router, playback_router, qa_router, transcribe_router
-from bard.config import get_settings
-from bard.database import init_db
+from bard.config import settings
+from bard.database import get_all_chapters, get_chapter, get_chapter_alignment, init_db
+from bard.services import llm, tts
+
+
+class PureASGICORS:
+    """Minimal ASGI CORS middleware.
+
+    Unlike Starlette's CORSMiddleware (which sits in the BaseHTTPMiddleware
+    family and buffers responses through an extra task per request), this
+    injects the Access-Control-* headers directly into the
+    ``http.response.start`` message and answers OPTIONS preflights without
+    touching the application at all.
+    """
+
+    # The Fetch spec ignores a literal "*" for credentialed requests, so
+    # methods are spelled out (mirroring Starlette's wildcard expansion)
+    # and requested headers are echoed back per preflight.
+    _ALL_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(self, app, allow_origins: list[str]) -> None:
+        self.app = app
+        self.allowed = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self._preflight_headers = [
+            (b"access-control-allow-methods", self._ALL_METHODS),
+            (b"access-control-max-age", b"600"),
+        ]
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or origin not in self.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        # Vary: Origin keeps shared caches from replaying one origin's
+        # allow-origin header to another allowed origin (the playback
+        # responses are cacheable for an hour).
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"origin"),
+        ]
+
+        if scope["method"] == "OPTIONS":
+            # Short-circuit preflight without invoking the app
+            headers = cors_headers + self._preflight_headers
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the database and shared API clients for the app's lifetime."""
+    init_db()
+    # Route handlers push blocking SQLite work through to_thread; give the
+    # default anyio pool more headroom than its 40-token default.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+    # Prewarm the read caches so first-request latency is paid here, not by
+    # the first listener.
+    for chapter in get_all_chapters():
+        get_chapter(chapter.chapter_id)
+        get_chapter_alignment(chapter.chapter_id)
+    # Pre-warm the upstream TLS connections so the first listener question
+    # hits hot pools instead of paying the handshakes.
+    warmups = []
+    if settings.openai_api_key:
+        warmups.append(llm.warmup_llm())
+    if settings.elevenlabs_api_key:
+        warmups.append(tts.warmup_tts())
+    if warmups:
+        await asyncio.gather(*warmups)
+    # One client for the process so keep-alive connections to api.openai.com
+    # survive across requests instead of re-handshaking TLS per call.
+    app.state.openai = None
+    if settings.openai_api_key:
+        app.state.openai = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=settings.openai_max_keepalive,
+                    max_connections=settings.openai_max_connections,
+                )
+            ),
+        )
+    yield
+    if app.state.openai is not None:
+        await app.state.openai.close()
+    await llm.aclose_client()
+
 
 app = FastAPI(
     title="Bard",
     description="Interactive Audiobook System with AI Q&A",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Compress large JSON payloads (alignment and context responses are tens of
+# KB of highly compressible English text). minimum_size skips the tiny
+# constant endpoints, and Starlette's default exclude list already covers
+# audio/* so the MP3 range responses pass through untouched. Added before
+# CORS so CORS stays outermost and preflights never hit the compressor.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware for frontend
 app.add_middleware(
-    CORSMiddleware,
+    PureASGICORS,
     allow_origins=[
         "http://localhost:5173",  # Vite dev server
         "http://localhost:3000",
         "http://127.0.0.1:5173",
         "http://127.0.0.1:3000",
     ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
 )
 
 # Include routers
@@ -35,37 +162,41 @@ app.include_router(qa_router)
 app.include_router(transcribe_router)
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Initialize database on startup."""
-    init_db()
+# Both payloads are constants; serving prebuilt bytes lets Starlette skip the
+# serialization stack entirely, which matters for high-frequency LB health
+# checks.
+_HEALTH_BODY = b'{"status":"healthy","service":"bard"}'
+_ROOT_BODY = (
+    b'{"name":"Bard","description":"Interactive Audiobook System",'
+    b'"version":"0.1.0","docs":"/docs"}'
+)
 
 
 @app.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "bard"}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict:
+async def root() -> Response:
     """Root endpoint with API info."""
-    return {
-        "name": "Bard",
-        "description": "Interactive Audiobook System",
-        "version": "0.1.0",
-        "docs": "/docs",
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 def run() -> None:
     """Entry point for bard-serve command."""
-    settings = get_settings()
     uvicorn.run(
         "bard.api.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # Request these explicitly so a misconfigured environment fails loudly
+        # instead of silently falling back to the slower asyncio+h11 stack.
+        loop="uvloop",
+        http="httptools",
+        # Per-request access logging is a measurable cost; keep it in debug only.
+        access_log=settings.debug,
     )
 
 
@@ -1,14 +1,61 @@
 """Agent configuration routes for ElevenLabs Conversational AI."""
 
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import NamedTuple
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
-from bard.config import get_settings
+from bard.api.caching import etag_json_response
+from bard.config import settings
 from bard.database import get_chapter_alignment, get_chapter
 
 router = APIRouter(prefix="/agent", tags=["agent"])
 
 
+class _AlignmentIndex(NamedTuple):
+    """Precomputed per-chapter arrays for O(log N) position lookups.
+
+    Timestamps live in packed float64 ``array.array`` buffers so the bisect
+    probes walk contiguous memory instead of chasing boxed-float pointers.
+    """
+
+    sentence_ids: list[int]
+    start_times: array
+    end_times: array
+    texts: list[str]
+    cum_word_counts: array  # prefix sums: words in texts[0..i] inclusive
+
+
+# Alignment data is immutable once preprocessing has run, so each chapter's
+# index is computed once and reused for every /agent/context request.
+_alignment_indexes: dict[int, _AlignmentIndex] = {}
+
+
+def _get_alignment_index(chapter_id: int) -> _AlignmentIndex | None:
+    """Get (building if needed) the cached alignment index for a chapter."""
+    index = _alignment_indexes.get(chapter_id)
+    if index is None:
+        alignment = get_chapter_alignment(chapter_id)
+        if not alignment:
+            return None
+        index = _AlignmentIndex(
+            sentence_ids=[s.sentence_id for s in alignment],
+            start_times=array("d", (s.start_time for s in alignment)),
+            end_times=array("d", (s.end_time for s in alignment)),
+            texts=[s.text for s in alignment],
+            cum_word_counts=array(
+                "I", accumulate(len(s.text.split()) for s in alignment)
+            ),
+        )
+        _alignment_indexes[chapter_id] = index
+    return index
+
+
 class AgentConfigResponse(BaseModel):
     """Response model for agent configuration."""
 
@@ -26,13 +73,12 @@ class AgentSystemPrompt(BaseModel):
     instructions: str
 
 
-@router.get("/config", response_model=AgentConfigResponse)
-async def get_agent_config() -> AgentConfigResponse:
+@router.get("/config")
+async def get_agent_config(request: Request) -> Response:
     """Get the ElevenLabs agent configuration for the frontend.
-    
+
     Returns agent ID and settings needed to initialize the conversation.
     """
-    settings = get_settings()
 
     if not settings.elevenlabs_agent_id:
         raise HTTPException(
@@ -40,22 +86,22 @@ async def get_agent_config() -> AgentConfigResponse:
             detail="ElevenLabs agent not configured. Set ELEVENLABS_AGENT_ID in environment.",
         )
 
-    return AgentConfigResponse(
-        agent_id=settings.elevenlabs_agent_id,
-        voice_id=settings.elevenlabs_voice_id,
-        use_agent=settings.use_elevenlabs_agent,
-        conversation_timeout_ms=settings.conversation_timeout_ms,
-        max_context_words=settings.max_context_words,
+    return etag_json_response(
+        request,
+        "agent-config",
+        lambda: orjson.dumps(
+            AgentConfigResponse(
+                agent_id=settings.elevenlabs_agent_id,
+                voice_id=settings.elevenlabs_voice_id,
+                use_agent=settings.use_elevenlabs_agent,
+                conversation_timeout_ms=settings.conversation_timeout_ms,
+                max_context_words=settings.max_context_words,
+            ).model_dump()
+        ),
     )
 
 
-@router.get("/system-prompt", response_model=AgentSystemPrompt)
-async def get_system_prompt() -> AgentSystemPrompt:
-    """Get the system prompt to configure in the ElevenLabs agent dashboard.
-    
-    This is provided as a reference for setting up the agent.
-    """
-    prompt = """You are Bard, the narrator of this audiobook - the Gospel of Luke.
+_SYSTEM_PROMPT = """You are Bard, the narrator of this audiobook - the Gospel of Luke.
 
 The listener has paused the audiobook to ask you a question. Answer as a knowledgeable narrator drawing upon historical context, Jewish customs, geography, and character backgrounds.
 
@@ -67,7 +113,7 @@ CRITICAL RULES:
 
 The listener's current position in the audiobook will be provided via context updates."""
 
-    instructions = """Configure this agent in ElevenLabs dashboard with:
+_SYSTEM_PROMPT_INSTRUCTIONS = """Configure this agent in ElevenLabs dashboard with:
 1. Name: "Bard - Gospel of Luke Narrator"
 2. System Prompt: Use the prompt above
 3. Voice: Set to your narrator voice ID
@@ -75,7 +121,22 @@ The listener's current position in the audiobook will be provided via context up
 5. Interruptions: Enabled
 6. Tools: Add 'resume_audiobook' as a client tool"""
 
-    return AgentSystemPrompt(prompt=prompt, instructions=instructions)
+# The payload is a constant, so serialize it once at import time and serve
+# the raw bytes instead of rebuilding the model + JSON on every request.
+_SYSTEM_PROMPT_JSON = orjson.dumps(
+    AgentSystemPrompt(
+        prompt=_SYSTEM_PROMPT, instructions=_SYSTEM_PROMPT_INSTRUCTIONS
+    ).model_dump()
+)
+
+
+@router.get("/system-prompt")
+async def get_system_prompt(request: Request) -> Response:
+    """Get the system prompt to configure in the ElevenLabs agent dashboard.
+
+    This is provided as a reference for setting up the agent.
+    """
+    return etag_json_response(request, "agent-system-prompt", lambda: _SYSTEM_PROMPT_JSON)
 
 
 class ContextResponse(BaseModel):
@@ -99,43 +160,45 @@ async def get_context(
     Returns the text heard so far up to the current audio time,
     truncated to the configured max words for efficient context injection.
     """
-    settings = get_settings()
     
     # Get chapter info
-    chapter = get_chapter(chapter_id)
+    chapter = await asyncio.to_thread(get_chapter, chapter_id)
     if not chapter:
         raise HTTPException(status_code=404, detail=f"Chapter {chapter_id} not found")
     
-    # Get alignment data
-    alignment = get_chapter_alignment(chapter_id)
-    if not alignment:
+    # Get alignment data (hits the DB only on first access per chapter)
+    index = await asyncio.to_thread(_get_alignment_index, chapter_id)
+    if index is None:
         raise HTTPException(
-            status_code=404, 
+            status_code=404,
             detail=f"Alignment not available for chapter {chapter_id}"
         )
-    
-    # Find current sentence
+
+    # Binary-search the alignment arrays: `heard` is the number of sentences
+    # whose end_time <= audio_time, and the sentence at that position (if any)
+    # is the one currently being spoken.
+    heard = bisect_right(index.end_times, audio_time)
     current_sentence = None
     current_sentence_id = None
-    for sentence in alignment:
-        if audio_time >= sentence.start_time and audio_time <= sentence.end_time:
-            current_sentence = sentence.text
-            current_sentence_id = sentence.sentence_id
-            break
-    
-    # Get all sentences heard so far
-    sentences_heard = [s.text for s in alignment if s.end_time <= audio_time]
-    text_heard = " ".join(sentences_heard)
-    
-    # Truncate to max words (keep recent context)
+    if heard < len(index.texts) and index.start_times[heard] <= audio_time:
+        current_sentence = index.texts[heard]
+        current_sentence_id = index.sentence_ids[heard]
+
+    # Truncate to max words (keep recent context) using the prefix sums
+    # instead of re-splitting the full concatenated text each request.
     max_words = settings.max_context_words
-    words = text_heard.split()
-    word_count = len(words)
-    
+    cum = index.cum_word_counts
+    word_count = cum[heard - 1] if heard else 0
+
     if word_count > max_words:
-        text_heard = "..." + " ".join(words[-max_words:])
-        word_count = max_words
-    
+        # Smallest j with cum[j] >= word_count - max_words; sentences after j
+        # fit the budget.
+        j = bisect_left(cum, word_count - max_words, 0, heard)
+        text_heard = "..." + " ".join(index.texts[j + 1 : heard])
+        word_count -= cum[j]
+    else:
+        text_heard = " ".join(index.texts[:heard])
+
     return ContextResponse(
         chapter_id=chapter_id,
         chapter_title=chapter.title,
@@ -1,17 +1,46 @@
 """Question-answering routes for the Ask Bard feature."""
 
+import asyncio
 import time
+from collections import OrderedDict
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from bard.models import AskRequest, AskResponse, AskTimingInfo
-from bard.services.context import build_context, get_context_stats, resolve_current_sentence
+from bard.services.cache import answer_cache_key, get_answer, put_answer
+from bard.services.context import build_context_with_stats, resolve_current_sentence
 from bard.services.llm import generate_answer
-from bard.services.tts import get_answer_audio_path, synthesize_answer
+from bard.services.tts import (
+    get_answer_audio_path,
+    pcm_media_type,
+    prepare_answers_dir,
+    speak_answer_streaming,
+    synthesize_answer,
+)
 
 router = APIRouter(tags=["qa"])
 
+# Single-flight + result cache for /ask: concurrent identical questions at the
+# same position share one LLM/TTS computation, and recent answers are reused.
+_AnswerKey = tuple[int, str]
+_Answer = tuple[str, str | None, int]  # (answer_text, audio_url, sentence_count)
+
+_INFLIGHT: dict[_AnswerKey, asyncio.Task] = {}
+_RESULTS: OrderedDict[_AnswerKey, _Answer] = OrderedDict()
+_RESULTS_MAX = 512
+
+
+def _answer_key(sentence_id: int, question: str) -> _AnswerKey:
+    return (sentence_id, " ".join(question.strip().lower().split()))
+
+
+def _cache_result(key: _AnswerKey, value: _Answer) -> None:
+    _RESULTS[key] = value
+    _RESULTS.move_to_end(key)
+    while len(_RESULTS) > _RESULTS_MAX:
+        _RESULTS.popitem(last=False)
+
 
 @router.post("/ask", response_model=AskResponse)
 async def ask_question(request: AskRequest) -> AskResponse:
@@ -29,13 +58,72 @@ async def ask_question(request: AskRequest) -> AskResponse:
 
     try:
         # 1. Resolve current sentence from playback position
-        current_sentence = resolve_current_sentence(request.chapter_id, request.audio_time)
+        current_sentence = await asyncio.to_thread(
+            resolve_current_sentence, request.chapter_id, request.audio_time
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    # 2. Build narrative context (all text up to current sentence)
-    context = build_context(current_sentence.sentence_id)
-    context_stats = get_context_stats(current_sentence.sentence_id)
+    key = _answer_key(current_sentence.sentence_id, request.question)
+
+    # Cache hit: reuse a recently computed answer (and its audio) outright
+    cached = _RESULTS.get(key)
+    if cached is not None:
+        answer_text, audio_url, sentence_count = cached
+        # Mirror the persistent cache: if the mp3 was cleaned up since the
+        # answer was cached, drop the dead link instead of serving a 404
+        if audio_url is not None:
+            answer_id = audio_url.split("/")[2]
+            if await asyncio.to_thread(get_answer_audio_path, answer_id) is None:
+                audio_url = None
+                _RESULTS[key] = (answer_text, None, sentence_count)
+        return AskResponse(
+            answer=answer_text,
+            audio_url=audio_url,
+            current_sentence_id=current_sentence.sentence_id,
+            context_sentence_count=sentence_count,
+            timing=None,
+        )
+
+    # Single-flight: concurrent identical requests await the same task
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(_compute_answer(current_sentence.sentence_id, request.question))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _t: _INFLIGHT.pop(key, None))
+
+    answer_text, audio_url, sentence_count, timing_parts = await asyncio.shield(task)
+    # Same rule as the persistent cache: don't memoize a failed synthesis,
+    # so a repeat ask retries TTS instead of staying text-only.
+    if audio_url is not None:
+        _cache_result(key, (answer_text, audio_url, sentence_count))
+
+    context_build_ms, llm_ms, tts_ms = timing_parts
+    t_end = time.perf_counter()
+    timing = AskTimingInfo(
+        total_ms=(t_end - t_start) * 1000,
+        context_build_ms=context_build_ms,
+        openai_llm_ms=llm_ms,
+        elevenlabs_tts_ms=tts_ms,
+    )
+
+    return AskResponse(
+        answer=answer_text,
+        audio_url=audio_url,
+        current_sentence_id=current_sentence.sentence_id,
+        context_sentence_count=sentence_count,
+        timing=timing,
+    )
+
+
+async def _compute_answer(
+    sentence_id: int, question: str
+) -> tuple[str, str | None, int, tuple[float, float, float | None]]:
+    """Build context, generate the answer, and synthesize audio for one question."""
+    t_start = time.perf_counter()
+
+    # Build narrative context (all text up to current sentence) off the loop
+    context, context_stats = await asyncio.to_thread(build_context_with_stats, sentence_id)
 
     t_context_done = time.perf_counter()
 
@@ -44,46 +132,56 @@ async def ask_question(request: AskRequest) -> AskResponse:
             status_code=400, detail="No narrative context available at this position"
         )
 
-    # 3. Generate answer using OpenAI
-    try:
-        answer_text = await generate_answer(context, request.question)
-    except ValueError as e:
-        raise HTTPException(status_code=500, detail=f"LLM error: {e}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate answer: {e}")
+    # Persistent cache: the same question at the same narrative position
+    # reuses the stored answer text and mp3 across restarts
+    cache_key = answer_cache_key(context, question)
+    cached = await asyncio.to_thread(get_answer, cache_key)
+    if cached is not None:
+        answer_text, audio_url = cached
+        t_hit = time.perf_counter()
+        timing_parts = ((t_context_done - t_start) * 1000, (t_hit - t_context_done) * 1000, None)
+        return answer_text, audio_url, context_stats["sentence_count"], timing_parts
+
+    # Generate answer using OpenAI; the answers-directory prep overlaps the
+    # LLM round-trip so synthesis starts against a ready path
+    answer_result, _ = await asyncio.gather(
+        generate_answer(context, question),
+        asyncio.to_thread(prepare_answers_dir),
+        return_exceptions=True,
+    )
+    if isinstance(answer_result, ValueError):
+        raise HTTPException(status_code=500, detail=f"LLM error: {answer_result}")
+    if isinstance(answer_result, BaseException):
+        raise HTTPException(status_code=500, detail=f"Failed to generate answer: {answer_result}")
+    answer_text = answer_result
 
     t_llm_done = time.perf_counter()
 
-    # 4. Synthesize answer to audio
+    # Synthesize answer to audio
     tts_ms = None
     try:
         audio_url = await synthesize_answer(answer_text)
-        t_tts_done = time.perf_counter()
-        tts_ms = (t_tts_done - t_llm_done) * 1000
+        tts_ms = (time.perf_counter() - t_llm_done) * 1000
     except ValueError as e:
         raise HTTPException(status_code=500, detail=f"TTS error: {e}")
     except Exception as e:
         # Return answer without audio if TTS fails (e.g., quota exceeded)
         print(f"Warning: TTS synthesis failed: {e}")
         audio_url = None
-        t_tts_done = time.perf_counter()
-
-    # Calculate timing
-    t_end = time.perf_counter()
-    timing = AskTimingInfo(
-        total_ms=(t_end - t_start) * 1000,
-        context_build_ms=(t_context_done - t_start) * 1000,
-        openai_llm_ms=(t_llm_done - t_context_done) * 1000,
-        elevenlabs_tts_ms=tts_ms,
-    )
 
-    return AskResponse(
-        answer=answer_text,
-        audio_url=audio_url,
-        current_sentence_id=current_sentence.sentence_id,
-        context_sentence_count=context_stats["sentence_count"],
-        timing=timing,
+    # Cache only fully-formed answers: a missing audio_url means TTS
+    # failed (e.g. quota exceeded), and persisting that would pin the
+    # text-only result across restarts long after the quota recovers.
+    # Left uncached, the next identical ask retries synthesis.
+    if audio_url is not None:
+        await asyncio.to_thread(put_answer, cache_key, answer_text, audio_url)
+
+    timing_parts = (
+        (t_context_done - t_start) * 1000,
+        (t_llm_done - t_context_done) * 1000,
+        tts_ms,
     )
+    return answer_text, audio_url, context_stats["sentence_count"], timing_parts
 
 
 @router.post("/ask/text-only")
@@ -93,12 +191,15 @@ async def ask_question_text_only(request: AskRequest) -> dict:
     Useful for testing or when audio isn't needed.
     """
     try:
-        current_sentence = resolve_current_sentence(request.chapter_id, request.audio_time)
+        current_sentence = await asyncio.to_thread(
+            resolve_current_sentence, request.chapter_id, request.audio_time
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    context = build_context(current_sentence.sentence_id)
-    context_stats = get_context_stats(current_sentence.sentence_id)
+    context, context_stats = await asyncio.to_thread(
+        build_context_with_stats, current_sentence.sentence_id
+    )
 
     if not context:
         raise HTTPException(status_code=400, detail="No narrative context available")
@@ -118,18 +219,52 @@ async def ask_question_text_only(request: AskRequest) -> dict:
     }
 
 
+@router.post("/ask/stream")
+async def ask_question_stream(request: AskRequest) -> StreamingResponse:
+    """Ask a question and stream the spoken answer as raw PCM.
+
+    The LLM's output is fed into TTS sentence-by-sentence as it is
+    generated, so the first audio reaches the client while the rest of
+    the answer is still being written. Nothing is persisted; use /ask
+    when the answer audio should be retrievable afterwards.
+    """
+    try:
+        current_sentence = await asyncio.to_thread(
+            resolve_current_sentence, request.chapter_id, request.audio_time
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    context, _ = await asyncio.to_thread(build_context_with_stats, current_sentence.sentence_id)
+
+    if not context:
+        raise HTTPException(status_code=400, detail="No narrative context available")
+
+    return StreamingResponse(
+        speak_answer_streaming(context, request.question),
+        media_type=pcm_media_type(),
+        headers={"X-Sentence-Id": str(current_sentence.sentence_id)},
+    )
+
+
 @router.get("/answers/{answer_id}/audio")
 async def get_answer_audio(answer_id: str) -> FileResponse:
-    """Retrieve a generated answer audio file."""
+    """Retrieve a generated answer audio file.
+
+    FileResponse handles Range requests and, on servers that support the
+    pathsend extension, hands the transfer to the kernel without copying
+    the file through Python.
+    """
     audio_path = get_answer_audio_path(answer_id)
 
     if audio_path is None:
         raise HTTPException(status_code=404, detail="Answer audio not found")
 
     return FileResponse(
-        path=audio_path,
+        audio_path,
         media_type="audio/mpeg",
         filename=f"bard_answer_{answer_id}.mp3",
+        content_disposition_type="inline",
     )
 
 
@@ -140,12 +275,13 @@ async def get_context_preview(chapter_id: int, audio_time: float) -> dict:
     Useful for debugging and understanding what the LLM will see.
     """
     try:
-        current_sentence = resolve_current_sentence(chapter_id, audio_time)
+        current_sentence = await asyncio.to_thread(resolve_current_sentence, chapter_id, audio_time)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    context = build_context(current_sentence.sentence_id)
-    stats = get_context_stats(current_sentence.sentence_id)
+    context, stats = await asyncio.to_thread(
+        build_context_with_stats, current_sentence.sentence_id
+    )
 
     # Truncate context for preview (don't send the whole thing)
     context_preview = context[:2000] + "..." if len(context) > 2000 else context
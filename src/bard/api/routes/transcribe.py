@@ -1,17 +1,31 @@
 """Speech-to-text transcription route."""
 
-import tempfile
 import time
 from pathlib import Path
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
-from openai import AsyncOpenAI
+from fastapi import APIRouter, File, HTTPException, Request, UploadFile
 from pydantic import BaseModel
 
-from bard.config import get_settings
+from bard.config import settings
 
 router = APIRouter(tags=["transcribe"])
 
+# Every supported format has an audio/* content type; a single C-level
+# startswith check replaces the old substring scan over nine candidates.
+# Missing or octet-stream types are allowed through for browser quirks.
+_VALID_CT_PREFIXES = ("audio/", "application/octet-stream")
+
+_EXT_BY_CT = {
+    "audio/wav": ".wav",
+    "audio/wave": ".wav",
+    "audio/x-wav": ".wav",
+    "audio/mp3": ".mp3",
+    "audio/mpeg": ".mp3",
+    "audio/ogg": ".ogg",
+    "audio/mp4": ".m4a",
+    "audio/m4a": ".m4a",
+}
+
 
 class TimingInfo(BaseModel):
     """Timing breakdown for performance measurement."""
@@ -30,39 +44,23 @@ class TranscriptionResponse(BaseModel):
 
 
 @router.post("/transcribe", response_model=TranscriptionResponse)
-async def transcribe_audio(audio: UploadFile = File(...)) -> TranscriptionResponse:
+async def transcribe_audio(request: Request, audio: UploadFile = File(...)) -> TranscriptionResponse:
     """Transcribe audio to text using OpenAI's speech-to-text model.
 
     Accepts audio in webm, wav, mp3, or other common formats.
     Returns the transcribed text.
     """
-    settings = get_settings()
 
     if not settings.openai_api_key:
         raise HTTPException(status_code=500, detail="OpenAI API key not configured")
 
-    # Validate file type
+    # Validate file type (lenient: empty/octet-stream allowed for browser quirks)
     content_type = audio.content_type or ""
-    valid_types = [
-        "audio/webm",
-        "audio/wav",
-        "audio/wave",
-        "audio/x-wav",
-        "audio/mp3",
-        "audio/mpeg",
-        "audio/ogg",
-        "audio/mp4",
-        "audio/m4a",
-    ]
-
-    # Be lenient with content type checking
-    if not any(vt in content_type for vt in valid_types) and content_type:
-        # Allow if no content type specified (browser quirks)
-        if content_type not in ["application/octet-stream", ""]:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid audio format: {content_type}. Supported: webm, wav, mp3, ogg, m4a",
-            )
+    if content_type and not content_type.startswith(_VALID_CT_PREFIXES):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid audio format: {content_type}. Supported: webm, wav, mp3, ogg, m4a",
+        )
 
     # Read audio data
     audio_data = await audio.read()
@@ -70,35 +68,29 @@ async def transcribe_audio(audio: UploadFile = File(...)) -> TranscriptionRespon
     if len(audio_data) == 0:
         raise HTTPException(status_code=400, detail="Empty audio file")
 
-    # Determine file extension from content type or filename
-    ext = ".webm"
+    # Determine file extension from filename, falling back to content type
     if audio.filename:
-        ext = Path(audio.filename).suffix or ext
-    elif "wav" in content_type:
-        ext = ".wav"
-    elif "mp3" in content_type or "mpeg" in content_type:
-        ext = ".mp3"
-    elif "ogg" in content_type:
-        ext = ".ogg"
+        ext = Path(audio.filename).suffix or _EXT_BY_CT.get(content_type, ".webm")
+    else:
+        ext = _EXT_BY_CT.get(content_type, ".webm")
 
     # Start timing
     t_start = time.perf_counter()
 
-    # Write to temp file (OpenAI API needs a file-like object with a name)
-    with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-        tmp.write(audio_data)
-        tmp_path = tmp.name
+    # The SDK accepts a (filename, bytes, content_type) tuple, so the upload
+    # bytes go straight to the API without a temp-file round-trip.
+    file_tuple = (f"audio{ext}", audio_data, content_type or "application/octet-stream")
 
     t_file_write = time.perf_counter()
 
     try:
-        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # Shared client created at startup; reuses pooled connections
+        client = request.app.state.openai
 
-        with open(tmp_path, "rb") as audio_file:
-            transcription = await client.audio.transcriptions.create(
-                file=audio_file,
-                model=settings.stt_model,
-            )
+        transcription = await client.audio.transcriptions.create(
+            file=file_tuple,
+            model=settings.stt_model,
+        )
 
         t_openai_done = time.perf_counter()
 
@@ -120,7 +112,3 @@ async def transcribe_audio(audio: UploadFile = File(...)) -> TranscriptionRespon
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
-
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
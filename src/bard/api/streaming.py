@@ -0,0 +1,102 @@
+"""Range-aware file streaming for audio endpoints.
+
+Serves large MP3 files with proper HTTP Range support (206 Partial
+Content) and a chunked ``os.pread`` sender, so seeking in the player
+transfers only the requested byte window instead of the whole file.
+"""
+
+import os
+from pathlib import Path
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _file_range_iterator(path: Path, start: int, end: int):
+    """Yield the byte range [start, end] of a file in CHUNK_SIZE pieces."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        offset = start
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = os.pread(fd, min(CHUNK_SIZE, remaining), offset)
+            if not chunk:
+                break
+            offset += len(chunk)
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        os.close(fd)
+
+
+def _parse_range(range_header: str, file_size: int) -> tuple[int, int] | None:
+    """Parse a single `bytes=start-end` Range header.
+
+    Returns (start, end) clamped to the file, or None if the header is
+    malformed or unsatisfiable.
+    """
+    if not range_header.startswith("bytes="):
+        return None
+    range_spec = range_header[len("bytes=") :].split(",")[0].strip()
+    start_str, _, end_str = range_spec.partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else file_size - 1
+        elif end_str:
+            # Suffix range: last N bytes
+            start = max(file_size - int(end_str), 0)
+            end = file_size - 1
+        else:
+            return None
+    except ValueError:
+        return None
+    if start >= file_size or start > end:
+        return None
+    return start, min(end, file_size - 1)
+
+
+def range_file_response(
+    path: Path,
+    request: Request,
+    media_type: str,
+    filename: str,
+    extra_headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream a file, honoring an optional Range request header."""
+    file_size = os.stat(path).st_size
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'inline; filename="{filename}"',
+    }
+    if extra_headers:
+        headers.update(extra_headers)
+
+    range_header = request.headers.get("range")
+    if range_header:
+        byte_range = _parse_range(range_header, file_size)
+        if byte_range is None:
+            raise HTTPException(
+                status_code=416,
+                detail="Requested range not satisfiable",
+                headers={"Content-Range": f"bytes */{file_size}"},
+            )
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            _file_range_iterator(path, start, end),
+            status_code=206,
+            media_type=media_type,
+            headers=headers,
+        )
+
+    headers["Content-Length"] = str(file_size)
+    return StreamingResponse(
+        _file_range_iterator(path, 0, file_size - 1),
+        media_type=media_type,
+        headers=headers,
+    )
@@ -1,8 +1,8 @@
 """Configuration management for Bard."""
 
-from functools import lru_cache
 from pathlib import Path
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,11 +32,22 @@ class Settings(BaseSettings):
     # TTS Settings
     tts_model_id: str = "eleven_flash_v2_5"
     tts_output_format: str = "mp3_44100_128"
+    # Raw PCM for live answer streaming: no container to finalize, so the
+    # first audible bytes reach the client sooner. Persisted files stay mp3.
+    tts_stream_format: str = "pcm_24000"
 
     # OpenAI Settings
     openai_model: str = "gpt-5-nano"
     stt_model: str = "gpt-4o-mini-transcribe"
     max_context_tokens: int = 100000
+    # Connection pool for the shared OpenAI client; size for the burst of
+    # simultaneous questions, not the steady state
+    openai_max_connections: int = 50
+    openai_max_keepalive: int = 20
+    # Concurrent in-flight requests per provider; size to the account's
+    # rate tier so bursts queue briefly instead of tripping 429 backoff
+    openai_max_concurrency: int = 8
+    tts_max_concurrency: int = 4
 
     # Conversation Settings
     conversation_timeout_ms: int = 10000  # Auto-resume after silence (ms)
@@ -47,25 +58,42 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = False
 
+    # Absolute paths, joined once at load time so the per-request accessors
+    # below don't re-walk Path internals.
+    _project_root: Path = PrivateAttr()
+    _data_path: Path = PrivateAttr()
+    _audio_path: Path = PrivateAttr()
+    _abs_db_path: Path = PrivateAttr()
+
+    def model_post_init(self, __context) -> None:
+        self._project_root = Path(__file__).parent.parent.parent
+        self._data_path = self._project_root / self.data_dir
+        self._audio_path = self._project_root / self.audio_dir
+        self._abs_db_path = self._project_root / self.db_path
+
     @property
     def project_root(self) -> Path:
         """Get the project root directory."""
-        return Path(__file__).parent.parent.parent
+        return self._project_root
 
     def get_data_path(self) -> Path:
         """Get absolute path to data directory."""
-        return self.project_root / self.data_dir
+        return self._data_path
 
     def get_audio_path(self) -> Path:
         """Get absolute path to audio directory."""
-        return self.project_root / self.audio_dir
+        return self._audio_path
 
     def get_db_path(self) -> Path:
         """Get absolute path to database."""
-        return self.project_root / self.db_path
+        return self._abs_db_path
+
+
+# Settings are immutable once loaded; bind them at import time so request
+# paths do plain attribute access instead of a cached function call.
+settings = Settings()
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the process-wide settings instance."""
+    return settings
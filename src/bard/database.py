@@ -1,20 +1,34 @@
 """SQLite database management for Bard."""
 
+import atexit
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from bard.config import get_settings
 from bard.models import Chapter, ChapterInfo, Sentence, SentenceAlignment
 
+# Batch list validation is noticeably faster than per-instance model init
+# for the multi-row read paths.
+_CHAPTER_INFO_LIST = TypeAdapter(list[ChapterInfo])
+_ALIGNMENT_LIST = TypeAdapter(list[SentenceAlignment])
+
 SCHEMA = """
 -- Chapters: one audio file per chapter
 CREATE TABLE IF NOT EXISTS chapters (
     chapter_id INTEGER PRIMARY KEY,
     title TEXT NOT NULL,
     audio_path TEXT,
-    duration_seconds REAL
+    duration_seconds REAL,
+    -- Denormalized: maintained by the sentence writers so listing chapters
+    -- never has to join and aggregate the sentences table
+    sentence_count INTEGER NOT NULL DEFAULT 0
 );
 
 -- Sentences: alignment data with timestamps
@@ -27,10 +41,39 @@ CREATE TABLE IF NOT EXISTS sentences (
     end_time REAL
 );
 
--- Indexes for efficient queries
+-- Indexes for efficient queries. sentence_id needs no index of its own:
+-- it is the INTEGER PRIMARY KEY (the rowid), so PK lookups are free.
 CREATE INDEX IF NOT EXISTS idx_sentences_chapter ON sentences(chapter_id, sequence);
-CREATE INDEX IF NOT EXISTS idx_sentences_time ON sentences(chapter_id, start_time);
-CREATE INDEX IF NOT EXISTS idx_sentences_id ON sentences(sentence_id);
+
+-- Covering index for find_sentence_at_time: the descending start_time walk
+-- finds the row and every selected column without touching the table heap.
+-- Costs extra index storage (it duplicates text) for one-seek lookups.
+CREATE INDEX IF NOT EXISTS idx_sent_time_cover
+    ON sentences(chapter_id, start_time DESC, end_time, sentence_id, sequence, text);
+
+-- Assembled narrative context per position, populated lazily on first
+-- use so repeat questions read one row instead of re-scanning and
+-- re-joining every prior sentence. Cleared whenever sentences change.
+CREATE TABLE IF NOT EXISTS context_snapshots (
+    sentence_id INTEGER PRIMARY KEY REFERENCES sentences(sentence_id),
+    text TEXT NOT NULL,
+    token_count INTEGER NOT NULL,
+    sentence_count INTEGER NOT NULL,
+    chapter_count INTEGER NOT NULL
+);
+
+-- Answers already generated for a (context, question) pair, so repeat
+-- questions skip the LLM and TTS round-trips entirely
+CREATE TABLE IF NOT EXISTS answer_cache (
+    cache_key TEXT PRIMARY KEY,
+    answer_text TEXT NOT NULL,
+    audio_url TEXT,
+    created_at REAL NOT NULL DEFAULT (unixepoch())
+);
+
+-- Migrations: drop indexes superseded above from older databases
+DROP INDEX IF EXISTS idx_sentences_id;
+DROP INDEX IF EXISTS idx_sentences_time;
 """
 
 
@@ -42,32 +85,160 @@ def get_db_path() -> Path:
     return db_path
 
 
+# One long-lived connection per thread, so SQLite's page cache and prepared
+# statements survive across calls instead of being torn down on every query.
+_local = threading.local()
+_open_connections: set[sqlite3.Connection] = set()
+_open_lock = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Get this thread's cached connection, opening it on first use.
+
+    Keyed by the current db path so a path change (tests pointing at a
+    temporary database) transparently reopens against the new file.
+    """
+    db_path = get_db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.db_path != db_path:
+        if conn is not None:
+            with _open_lock:
+                _open_connections.discard(conn)
+            conn.close()
+        # Bigger statement cache than the default 100 so every query in this
+        # module stays compiled for the connection's lifetime. The same-thread
+        # check is off so the atexit hook can close (and PRAGMA optimize)
+        # connections owned by worker threads; access stays serialized
+        # because each thread only ever touches its own cached connection.
+        conn = sqlite3.connect(db_path, cached_statements=256, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers proceed while preprocessing writes; the rest trade
+        # a little durability (NORMAL is still crash-safe in WAL mode) and
+        # memory for far fewer fsyncs and page-cache misses.
+        conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+            PRAGMA foreign_keys=ON;
+            """
+        )
+        _local.conn = conn
+        _local.db_path = db_path
+        with _open_lock:
+            _open_connections.add(conn)
+    return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    with _open_lock:
+        for conn in _open_connections:
+            try:
+                # Standard SQLite guidance: let it fold fresh query history
+                # into the stats before the connection goes away.
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+        _open_connections.clear()
+
+
 @contextmanager
 def get_connection() -> Generator[sqlite3.Connection, None, None]:
-    """Get a database connection with row factory."""
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    """Get the shared per-thread database connection.
+
+    The connection stays open after the block exits; all existing
+    ``with get_connection() as conn:`` call sites work unchanged.
+    """
+    yield _get_conn()
+
+
+@contextmanager
+def transaction() -> Generator[sqlite3.Connection, None, None]:
+    """Group multiple write helpers into one explicit transaction.
+
+    While the block is active, the write functions in this module skip
+    their per-call commit, so e.g. a whole chapter's alignment updates
+    hit disk with a single COMMIT instead of one fsync per statement.
+    """
+    conn = _get_conn()
+    conn.execute("BEGIN IMMEDIATE")
+    _local.explicit_txn = True
     try:
         yield conn
+    except BaseException:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        _local.explicit_txn = False
+    conn.commit()
+
+
+def _commit(conn: sqlite3.Connection) -> None:
+    """Commit unless the caller opened an explicit transaction()."""
+    if not getattr(_local, "explicit_txn", False):
+        conn.commit()
+
+
+def _refresh_sentence_counts(conn: sqlite3.Connection) -> None:
+    """Recompute the denormalized chapters.sentence_count column."""
+    conn.execute(
+        """
+        UPDATE chapters SET sentence_count =
+            (SELECT COUNT(*) FROM sentences WHERE chapter_id = chapters.chapter_id)
+        """
+    )
 
 
 def init_db() -> None:
     """Initialize the database schema."""
     with get_connection() as conn:
+        # Migration: databases created before the denormalized counter need
+        # the column added (and backfilled) before the schema script runs.
+        tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'chapters'"
+        ).fetchone()
+        needs_backfill = False
+        if tables:
+            cols = {row["name"] for row in conn.execute("PRAGMA table_info(chapters)")}
+            if "sentence_count" not in cols:
+                conn.execute(
+                    "ALTER TABLE chapters ADD COLUMN sentence_count INTEGER NOT NULL DEFAULT 0"
+                )
+                needs_backfill = True
         conn.executescript(SCHEMA)
+        if needs_backfill:
+            _refresh_sentence_counts(conn)
         conn.commit()
+    clear_read_caches()
 
 
 def reset_db() -> None:
     """Drop all tables and reinitialize."""
     with get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS context_snapshots")
         conn.execute("DROP TABLE IF EXISTS sentences")
         conn.execute("DROP TABLE IF EXISTS chapters")
+        conn.execute("DROP TABLE IF EXISTS answer_cache")
         conn.executescript(SCHEMA)
         conn.commit()
+    clear_read_caches()
+
+
+def clear_read_caches() -> None:
+    """Invalidate the in-process read caches after any write.
+
+    Chapter metadata and alignment are immutable while serving, so the
+    cached reads only need flushing when preprocessing (or tests) mutate
+    the database.
+    """
+    get_chapter.cache_clear()
+    get_chapter_info.cache_clear()
+    get_all_chapters.cache_clear()
+    get_chapter_alignment.cache_clear()
 
 
 # Chapter operations
@@ -83,9 +254,11 @@ def insert_chapter(chapter: Chapter) -> None:
             """,
             (chapter.chapter_id, chapter.title, chapter.audio_path, chapter.duration_seconds),
         )
-        conn.commit()
+        _commit(conn)
+    clear_read_caches()
 
 
+@lru_cache(maxsize=64)
 def get_chapter(chapter_id: int) -> Chapter | None:
     """Get a chapter by ID."""
     with get_connection() as conn:
@@ -95,19 +268,35 @@ def get_chapter(chapter_id: int) -> Chapter | None:
         return None
 
 
+@lru_cache(maxsize=64)
 def get_all_chapters() -> list[ChapterInfo]:
     """Get all chapters with sentence counts."""
     with get_connection() as conn:
         rows = conn.execute(
             """
-            SELECT c.chapter_id, c.title, c.duration_seconds, COUNT(s.sentence_id) as sentence_count
-            FROM chapters c
-            LEFT JOIN sentences s ON c.chapter_id = s.chapter_id
-            GROUP BY c.chapter_id
-            ORDER BY c.chapter_id
+            SELECT chapter_id, title, duration_seconds, sentence_count
+            FROM chapters
+            ORDER BY chapter_id
             """
         ).fetchall()
-        return [ChapterInfo(**dict(row)) for row in rows]
+        return _CHAPTER_INFO_LIST.validate_python([dict(row) for row in rows])
+
+
+@lru_cache(maxsize=64)
+def get_chapter_info(chapter_id: int) -> ChapterInfo | None:
+    """Get a single chapter with its sentence count."""
+    with get_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT chapter_id, title, duration_seconds, sentence_count
+            FROM chapters
+            WHERE chapter_id = ?
+            """,
+            (chapter_id,),
+        ).fetchone()
+        if row:
+            return ChapterInfo(**dict(row))
+        return None
 
 
 def update_chapter_audio(chapter_id: int, audio_path: str, duration_seconds: float) -> None:
@@ -120,21 +309,47 @@ def update_chapter_audio(chapter_id: int, audio_path: str, duration_seconds: flo
             """,
             (audio_path, duration_seconds, chapter_id),
         )
-        conn.commit()
+        _commit(conn)
+    clear_read_caches()
 
 
 # Sentence operations
 
 
+def _sentence_from_row(row: sqlite3.Row) -> Sentence:
+    """Hydrate a Sentence without validation.
+
+    Rows come out of our own schema, so model_construct's skip-validation
+    path is safe and noticeably cheaper than full model init on the
+    thousands-of-rows context reads.
+    """
+    return Sentence.model_construct(
+        sentence_id=row["sentence_id"],
+        chapter_id=row["chapter_id"],
+        sequence=row["sequence"],
+        text=row["text"],
+        start_time=row["start_time"],
+        end_time=row["end_time"],
+    )
+
+# Hoisted so repeated single-row writes reuse one statement-cache slot.
+_SQL_UPSERT_SENTENCE = """
+    INSERT OR REPLACE INTO sentences
+    (sentence_id, chapter_id, sequence, text, start_time, end_time)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_ALIGNMENT = """
+    UPDATE sentences SET start_time = ?, end_time = ?
+    WHERE sentence_id = ?
+"""
+
+
 def insert_sentence(sentence: Sentence) -> None:
     """Insert a sentence into the database."""
     with get_connection() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO sentences 
-            (sentence_id, chapter_id, sequence, text, start_time, end_time)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_UPSERT_SENTENCE,
             (
                 sentence.sentence_id,
                 sentence.chapter_id,
@@ -144,24 +359,44 @@ def insert_sentence(sentence: Sentence) -> None:
                 sentence.end_time,
             ),
         )
-        conn.commit()
+        conn.execute("DELETE FROM context_snapshots")
+        _refresh_sentence_counts(conn)
+        _commit(conn)
+    clear_read_caches()
+
+
+# Rows per compound statement; 6 params/row keeps the largest statement well
+# under SQLite's 32766-variable limit.
+_BATCH_ROWS = 5000
 
 
-def insert_sentences_batch(sentences: list[Sentence]) -> None:
-    """Insert multiple sentences in a single transaction."""
+def insert_sentences_batch(sentences: Iterable[Sentence]) -> None:
+    """Insert multiple sentences in a single transaction.
+
+    Rows go in as compound multi-row VALUES statements, which bind the
+    whole chunk in one execute instead of N statement steps. Accepts any
+    iterable and consumes it chunk by chunk, so generator callers never
+    materialize the full row list.
+    """
+    it = iter(sentences)
     with get_connection() as conn:
-        conn.executemany(
-            """
-            INSERT OR REPLACE INTO sentences 
-            (sentence_id, chapter_id, sequence, text, start_time, end_time)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (s.sentence_id, s.chapter_id, s.sequence, s.text, s.start_time, s.end_time)
-                for s in sentences
-            ],
-        )
-        conn.commit()
+        while chunk := list(islice(it, _BATCH_ROWS)):
+            sql = (
+                "INSERT OR REPLACE INTO sentences "
+                "(sentence_id, chapter_id, sequence, text, start_time, end_time) "
+                "VALUES " + ",".join(("(?, ?, ?, ?, ?, ?)",) * len(chunk))
+            )
+            params = list(
+                chain.from_iterable(
+                    (s.sentence_id, s.chapter_id, s.sequence, s.text, s.start_time, s.end_time)
+                    for s in chunk
+                )
+            )
+            conn.execute(sql, params)
+        conn.execute("DELETE FROM context_snapshots")
+        _refresh_sentence_counts(conn)
+        _commit(conn)
+    clear_read_caches()
 
 
 def get_sentence(sentence_id: int) -> Sentence | None:
@@ -171,7 +406,7 @@ def get_sentence(sentence_id: int) -> Sentence | None:
             "SELECT * FROM sentences WHERE sentence_id = ?", (sentence_id,)
         ).fetchone()
         if row:
-            return Sentence(**dict(row))
+            return _sentence_from_row(row)
         return None
 
 
@@ -186,9 +421,10 @@ def get_chapter_sentences(chapter_id: int) -> list[Sentence]:
             """,
             (chapter_id,),
         ).fetchall()
-        return [Sentence(**dict(row)) for row in rows]
+        return [_sentence_from_row(row) for row in rows]
 
 
+@lru_cache(maxsize=64)
 def get_chapter_alignment(chapter_id: int) -> list[SentenceAlignment]:
     """Get alignment data for a chapter."""
     with get_connection() as conn:
@@ -201,37 +437,39 @@ def get_chapter_alignment(chapter_id: int) -> list[SentenceAlignment]:
             """,
             (chapter_id,),
         ).fetchall()
-        return [SentenceAlignment(**dict(row)) for row in rows]
+        return _ALIGNMENT_LIST.validate_python([dict(row) for row in rows])
 
 
 def update_sentence_alignment(sentence_id: int, start_time: float, end_time: float) -> None:
     """Update alignment times for a sentence."""
     with get_connection() as conn:
         conn.execute(
-            """
-            UPDATE sentences SET start_time = ?, end_time = ?
-            WHERE sentence_id = ?
-            """,
+            _SQL_UPDATE_ALIGNMENT,
             (start_time, end_time, sentence_id),
         )
-        conn.commit()
+        _commit(conn)
+    clear_read_caches()
 
 
-def update_alignments_batch(alignments: list[tuple[int, float, float]]) -> None:
+def update_alignments_batch(alignments: Iterable[tuple[int, float, float]]) -> None:
     """Update multiple sentence alignments in a single transaction.
 
     Args:
-        alignments: List of (sentence_id, start_time, end_time) tuples
+        alignments: Iterable of (sentence_id, start_time, end_time) tuples
     """
+    it = iter(alignments)
     with get_connection() as conn:
-        conn.executemany(
-            """
-            UPDATE sentences SET start_time = ?, end_time = ?
-            WHERE sentence_id = ?
-            """,
-            [(start, end, sid) for sid, start, end in alignments],
-        )
-        conn.commit()
+        while chunk := list(islice(it, _BATCH_ROWS)):
+            sql = (
+                "WITH v(sid, s, e) AS (VALUES "
+                + ",".join(("(?, ?, ?)",) * len(chunk))
+                + ") UPDATE sentences SET start_time = v.s, end_time = v.e "
+                "FROM v WHERE sentences.sentence_id = v.sid"
+            )
+            params = list(chain.from_iterable(chunk))
+            conn.execute(sql, params)
+        _commit(conn)
+    clear_read_caches()
 
 
 # Context retrieval for RAG
@@ -244,24 +482,12 @@ def find_sentence_at_time(chapter_id: int, audio_time: float) -> Sentence | None
     If audio_time is before the first sentence or in a gap, returns the next sentence.
     """
     with get_connection() as conn:
-        # First try exact match
+        # The most recent sentence starting at or before audio_time covers
+        # both the containment case and the in-a-gap case, so one descending
+        # index walk replaces the old exact-match-then-fallback pair.
         row = conn.execute(
             """
-            SELECT * FROM sentences 
-            WHERE chapter_id = ? AND start_time <= ? AND end_time >= ?
-            ORDER BY start_time DESC
-            LIMIT 1
-            """,
-            (chapter_id, audio_time, audio_time),
-        ).fetchone()
-
-        if row:
-            return Sentence(**dict(row))
-
-        # If no exact match, find the most recent sentence before this time
-        row = conn.execute(
-            """
-            SELECT * FROM sentences 
+            SELECT * FROM sentences
             WHERE chapter_id = ? AND start_time <= ?
             ORDER BY start_time DESC
             LIMIT 1
@@ -269,41 +495,108 @@ def find_sentence_at_time(chapter_id: int, audio_time: float) -> Sentence | None
             (chapter_id, audio_time),
         ).fetchone()
 
-        if row:
-            return Sentence(**dict(row))
-
-        # If still no match, return the first sentence of the chapter
-        row = conn.execute(
-            """
-            SELECT * FROM sentences 
-            WHERE chapter_id = ?
-            ORDER BY sequence
-            LIMIT 1
-            """,
-            (chapter_id,),
-        ).fetchone()
+        if row is None:
+            # Before the first aligned sentence: return the chapter opener
+            row = conn.execute(
+                """
+                SELECT * FROM sentences
+                WHERE chapter_id = ?
+                ORDER BY sequence
+                LIMIT 1
+                """,
+                (chapter_id,),
+            ).fetchone()
 
         if row:
-            return Sentence(**dict(row))
-
+            return _sentence_from_row(row)
         return None
 
 
 def get_context_sentences(up_to_sentence_id: int) -> list[Sentence]:
-    """Get all sentences up to and including the given sentence ID.
+    """Get sentences up to and including the given sentence ID.
 
     This returns sentences in narrative order (by chapter, then sequence).
     """
     with get_connection() as conn:
         rows = conn.execute(
             """
-            SELECT * FROM sentences 
+            SELECT * FROM sentences
             WHERE sentence_id <= ?
             ORDER BY chapter_id, sequence
             """,
             (up_to_sentence_id,),
         ).fetchall()
-        return [Sentence(**dict(row)) for row in rows]
+        return [_sentence_from_row(row) for row in rows]
+
+
+def build_context_rows(
+    up_to_sentence_id: int, limit: int | None = None
+) -> list[tuple[int, str, str]]:
+    """Get context sentences joined with their chapter title in one query.
+
+    Returns (chapter_id, title, text) tuples in narrative order. Feeding
+    the assembler plain tuples from a single JOIN halves the round-trips
+    of fetching sentences and chapter metadata separately, and skips
+    model hydration the assembler doesn't need. When ``limit`` is set,
+    only the most recent ``limit`` sentences are returned (still in
+    narrative order), with the cut done in SQL so the older rows never
+    reach Python.
+    """
+    with get_connection() as conn:
+        if limit is None:
+            rows = conn.execute(
+                """
+                SELECT s.chapter_id, c.title, s.text
+                FROM sentences s JOIN chapters c USING (chapter_id)
+                WHERE s.sentence_id <= ?
+                ORDER BY s.chapter_id, s.sequence
+                """,
+                (up_to_sentence_id,),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                """
+                SELECT chapter_id, title, text FROM (
+                    SELECT s.chapter_id, c.title, s.text, s.sequence
+                    FROM sentences s JOIN chapters c USING (chapter_id)
+                    WHERE s.sentence_id <= ?
+                    ORDER BY s.chapter_id DESC, s.sequence DESC
+                    LIMIT ?
+                )
+                ORDER BY chapter_id, sequence
+                """,
+                (up_to_sentence_id, limit),
+            ).fetchall()
+        return [(row["chapter_id"], row["title"], row["text"]) for row in rows]
+
+
+def get_aligned_chapter_ids() -> set[int]:
+    """Get the IDs of chapters that already have alignment data."""
+    with get_connection() as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT chapter_id FROM sentences WHERE start_time IS NOT NULL"
+        ).fetchall()
+        return {row["chapter_id"] for row in rows}
+
+
+def find_alignment_issues() -> list[tuple[int, int, bool]]:
+    """Find sentences with missing or invalid alignment times.
+
+    Returns (chapter_id, sentence_id, missing) tuples, where missing is
+    True when a timestamp is NULL and False when start_time >= end_time.
+    Rows with healthy alignments never leave SQLite.
+    """
+    with get_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT chapter_id, sentence_id,
+                   (start_time IS NULL OR end_time IS NULL) AS missing
+            FROM sentences
+            WHERE start_time IS NULL OR end_time IS NULL OR start_time >= end_time
+            ORDER BY chapter_id, sentence_id
+            """
+        ).fetchall()
+        return [(row["chapter_id"], row["sentence_id"], bool(row["missing"])) for row in rows]
 
 
 def get_total_sentence_count() -> int:
@@ -311,3 +604,72 @@ def get_total_sentence_count() -> int:
     with get_connection() as conn:
         row = conn.execute("SELECT COUNT(*) as count FROM sentences").fetchone()
         return row["count"] if row else 0
+
+
+# Context snapshot operations
+
+
+def get_context_snapshot(sentence_id: int) -> tuple[str, dict] | None:
+    """Get the stored context and stats for a position, if snapshotted."""
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT text, token_count, sentence_count, chapter_count "
+            "FROM context_snapshots WHERE sentence_id = ?",
+            (sentence_id,),
+        ).fetchone()
+    if row is None:
+        return None
+    stats = {
+        "sentence_count": row["sentence_count"],
+        "chapter_count": row["chapter_count"],
+        "estimated_tokens": row["token_count"],
+    }
+    return row["text"], stats
+
+
+def store_context_snapshot(sentence_id: int, text: str, stats: dict) -> None:
+    """Store an assembled context so later questions here skip the scan."""
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO context_snapshots
+                (sentence_id, text, token_count, sentence_count, chapter_count)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                sentence_id,
+                text,
+                stats["estimated_tokens"],
+                stats["sentence_count"],
+                stats["chapter_count"],
+            ),
+        )
+        _commit(conn)
+
+
+# Answer cache operations
+
+
+def get_cached_answer(cache_key: str) -> tuple[str, str | None] | None:
+    """Look up a previously generated answer by its cache key."""
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT answer_text, audio_url FROM answer_cache WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+    if row is None:
+        return None
+    return row["answer_text"], row["audio_url"]
+
+
+def store_cached_answer(cache_key: str, answer_text: str, audio_url: str | None) -> None:
+    """Insert or refresh a cached answer."""
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO answer_cache (cache_key, answer_text, audio_url)
+            VALUES (?, ?, ?)
+            """,
+            (cache_key, answer_text, audio_url),
+        )
+        _commit(conn)
@@ -1,11 +1,13 @@
 """Pydantic models and data structures for Bard."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Chapter(BaseModel):
     """A chapter of the audiobook."""
 
+    model_config = ConfigDict(frozen=True)
+
     chapter_id: int
     title: str
     audio_path: str | None = None
@@ -15,6 +17,8 @@ class Chapter(BaseModel):
 class Sentence(BaseModel):
     """A sentence with alignment data."""
 
+    model_config = ConfigDict(frozen=True)
+
     sentence_id: int
     chapter_id: int
     sequence: int  # Order within chapter (0-indexed)
@@ -39,6 +43,8 @@ class PreparedText(BaseModel):
 class AlignmentData(BaseModel):
     """Alignment data for a single sentence."""
 
+    model_config = ConfigDict(frozen=True)
+
     sentence_id: int
     start: float
     end: float
@@ -47,6 +53,8 @@ class AlignmentData(BaseModel):
 class ChapterAlignment(BaseModel):
     """Alignment data for a chapter."""
 
+    model_config = ConfigDict(frozen=True)
+
     chapter_id: int
     sentences: list[AlignmentData]
 
@@ -91,6 +99,8 @@ class AskResponse(BaseModel):
 class ChapterInfo(BaseModel):
     """Chapter information for API responses."""
 
+    model_config = ConfigDict(frozen=True)
+
     chapter_id: int
     title: str
     duration_seconds: float | None
@@ -100,6 +110,8 @@ class ChapterInfo(BaseModel):
 class SentenceAlignment(BaseModel):
     """Sentence alignment info for API responses."""
 
+    model_config = ConfigDict(frozen=True)
+
     sentence_id: int
     sequence: int
     text: str
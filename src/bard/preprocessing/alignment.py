@@ -3,106 +3,91 @@
 This module aligns chapter audio with sentence text to produce timestamps.
 """
 
-import json
-import subprocess
+import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import orjson
+
 from bard.config import get_settings
 from bard.database import (
+    find_alignment_issues,
+    get_aligned_chapter_ids,
     get_all_chapters,
     get_chapter_sentences,
+    transaction,
     update_alignments_batch,
 )
-from bard.models import AlignmentData, ChapterAlignment
+from bard.models import AlignmentData, ChapterAlignment, Sentence
 
 
-def create_sentence_file(chapter_id: int, temp_dir: Path) -> Path:
+def create_sentence_file(chapter_id: int, sentences: list[Sentence], temp_dir: Path) -> Path:
     """Create a text file with one sentence per line for Aeneas input."""
-    sentences = get_chapter_sentences(chapter_id)
     text_path = temp_dir / f"chapter_{chapter_id}.txt"
-
-    with open(text_path, "w", encoding="utf-8") as f:
-        for sentence in sentences:
-            # Write each sentence on its own line
-            f.write(sentence.text + "\n")
-
+    # One sentence per line, written as a single buffer
+    text_path.write_text("\n".join(s.text for s in sentences) + "\n", encoding="utf-8")
     return text_path
 
 
 def run_aeneas_alignment(
     audio_path: Path,
     text_path: Path,
-    output_path: Path,
-) -> dict:
+) -> list[tuple[float, float]]:
     """Run Aeneas to align audio with text.
 
-    Uses the aeneas command-line tool for alignment.
+    Drives aeneas in-process instead of shelling out to
+    ``python -m aeneas.tools.execute_task``, which paid interpreter
+    startup plus the heavy aeneas import once per chapter. The sync map
+    is read straight off the task object — no JSON file round-trip.
 
     Args:
         audio_path: Path to the chapter audio file
         text_path: Path to the sentence text file
-        output_path: Path for JSON output
 
     Returns:
-        Parsed JSON alignment data
+        (begin, end) timestamps, one per input line
     """
+    # Imported lazily: aeneas pulls in numpy/ffmpeg machinery that the rest
+    # of the package should not require just to be importable.
+    from aeneas.executetask import ExecuteTask
+    from aeneas.task import Task
+
     # Aeneas configuration
     # task_language=eng: English
     # is_text_type=plain: One sentence per line
-    # os_task_file_format=json: Output as JSON
-    config = "task_language=eng|is_text_type=plain|os_task_file_format=json"
-
-    cmd = [
-        "python",
-        "-m",
-        "aeneas.tools.execute_task",
-        str(audio_path),
-        str(text_path),
-        config,
-        str(output_path),
-    ]
-
-    print(f"  Running: {' '.join(cmd)}")
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=600,  # 10 minute timeout per chapter
-    )
+    config = "task_language=eng|is_text_type=plain"
 
-    if result.returncode != 0:
-        print(f"  Aeneas stderr: {result.stderr}")
-        raise RuntimeError(f"Aeneas failed with code {result.returncode}")
+    print(f"  Aligning in-process: {audio_path.name}")
 
-    # Parse output JSON
-    with open(output_path, encoding="utf-8") as f:
-        return json.load(f)
+    task = Task(config_string=config)
+    task.audio_file_path_absolute = str(audio_path)
+    task.text_file_path_absolute = str(text_path)
+    ExecuteTask(task).execute()
 
+    return [
+        (float(fragment.begin), float(fragment.end))
+        for fragment in task.sync_map.fragments
+    ]
 
-def parse_aeneas_output(aeneas_data: dict, chapter_id: int) -> ChapterAlignment:
-    """Parse Aeneas JSON output into our alignment format."""
-    sentences = get_chapter_sentences(chapter_id)
-    sentence_ids = [s.sentence_id for s in sentences]
 
-    fragments = aeneas_data.get("fragments", [])
+def parse_aeneas_output(
+    fragments: list[tuple[float, float]], chapter_id: int, sentence_ids: list[int]
+) -> ChapterAlignment:
+    """Turn aeneas (begin, end) fragments into our alignment format.
 
+    ``sentence_ids`` comes from the caller's already-loaded sentence list,
+    so the chapter's rows are not re-queried here.
+    """
     alignments: list[AlignmentData] = []
-    for i, fragment in enumerate(fragments):
+    for i, (begin, end) in enumerate(fragments):
         if i >= len(sentence_ids):
             print(
                 f"  Warning: More fragments ({len(fragments)}) than sentences ({len(sentence_ids)})"
             )
             break
 
-        alignments.append(
-            AlignmentData(
-                sentence_id=sentence_ids[i],
-                start=float(fragment["begin"]),
-                end=float(fragment["end"]),
-            )
-        )
+        alignments.append(AlignmentData(sentence_id=sentence_ids[i], start=begin, end=end))
 
     if len(alignments) < len(sentence_ids):
         print(
@@ -112,113 +97,133 @@ def parse_aeneas_output(aeneas_data: dict, chapter_id: int) -> ChapterAlignment:
     return ChapterAlignment(chapter_id=chapter_id, sentences=alignments)
 
 
-def align_chapter(chapter_id: int, force: bool = False) -> ChapterAlignment:
-    """Align a single chapter's audio with its sentences.
-
-    Args:
-        chapter_id: The chapter to align
-        force: If True, realign even if alignment exists
+def _compute_alignment(chapter_id: int) -> ChapterAlignment:
+    """Run aeneas for one chapter and return its alignment.
 
-    Returns:
-        ChapterAlignment with sentence timestamps
+    Does not write to the database, so it is safe to run in a worker
+    process; each worker opens its own read-only connection for the
+    sentence text, and all writes stay in the driver.
     """
     settings = get_settings()
-    audio_dir = settings.get_audio_path()
-    data_dir = settings.get_data_path()
-
-    audio_path = audio_dir / f"chapter_{chapter_id}.mp3"
+    audio_path = settings.get_audio_path() / f"chapter_{chapter_id}.mp3"
     if not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-    # Check if already aligned (unless force)
+    # Load the chapter's sentences once; both the aeneas input file and the
+    # output parsing reuse this list.
     sentences = get_chapter_sentences(chapter_id)
-    if not force and sentences and sentences[0].start_time is not None:
-        print(f"  Chapter {chapter_id} already aligned, skipping")
-        alignments = [
-            AlignmentData(sentence_id=s.sentence_id, start=s.start_time, end=s.end_time)
-            for s in sentences
-            if s.start_time is not None
-        ]
-        return ChapterAlignment(chapter_id=chapter_id, sentences=alignments)
+    sentence_ids = [s.sentence_id for s in sentences]
 
     # Create temporary directory for Aeneas files
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
         # Create sentence text file
-        text_path = create_sentence_file(chapter_id, temp_path)
-        output_path = temp_path / f"alignment_{chapter_id}.json"
+        text_path = create_sentence_file(chapter_id, sentences, temp_path)
 
-        # Run Aeneas
-        print(f"  Aligning {len(sentences)} sentences...")
-        aeneas_data = run_aeneas_alignment(audio_path, text_path, output_path)
-
-        # Parse results
-        alignment = parse_aeneas_output(aeneas_data, chapter_id)
+        # Run Aeneas and parse the in-memory sync map
+        fragments = run_aeneas_alignment(audio_path, text_path)
+        alignment = parse_aeneas_output(fragments, chapter_id, sentence_ids)
 
     # Save alignment to JSON for reference
-    alignment_dir = data_dir / "alignments"
+    alignment_dir = settings.get_data_path() / "alignments"
     alignment_dir.mkdir(parents=True, exist_ok=True)
     alignment_path = alignment_dir / f"chapter_{chapter_id}_alignment.json"
-    with open(alignment_path, "w", encoding="utf-8") as f:
-        json.dump(alignment.model_dump(), f, indent=2)
+    alignment_path.write_bytes(orjson.dumps(alignment.model_dump(), option=orjson.OPT_INDENT_2))
     print(f"  Saved alignment to {alignment_path}")
 
-    # Update database with alignment times
-    update_alignments_batch([(a.sentence_id, a.start, a.end) for a in alignment.sentences])
+    return alignment
+
+
+def _store_alignment(alignment: ChapterAlignment) -> None:
+    """Write a chapter's alignment times with one COMMIT."""
+    with transaction():
+        update_alignments_batch((a.sentence_id, a.start, a.end) for a in alignment.sentences)
     print(f"  Updated {len(alignment.sentences)} sentence alignments in database")
 
+
+def align_chapter(chapter_id: int, force: bool = False) -> ChapterAlignment:
+    """Align a single chapter's audio with its sentences.
+
+    Args:
+        chapter_id: The chapter to align
+        force: If True, realign even if alignment exists
+
+    Returns:
+        ChapterAlignment with sentence timestamps
+    """
+    # Check if already aligned (unless force); the sentence rows are only
+    # loaded when the skip path needs to echo the existing alignment back.
+    if not force and chapter_id in get_aligned_chapter_ids():
+        print(f"  Chapter {chapter_id} already aligned, skipping")
+        alignments = [
+            AlignmentData(sentence_id=s.sentence_id, start=s.start_time, end=s.end_time)
+            for s in get_chapter_sentences(chapter_id)
+            if s.start_time is not None
+        ]
+        return ChapterAlignment(chapter_id=chapter_id, sentences=alignments)
+
+    alignment = _compute_alignment(chapter_id)
+    _store_alignment(alignment)
     return alignment
 
 
 def align_all_chapters(force: bool = False, start_chapter: int = 1) -> None:
-    """Align all chapters.
+    """Align all chapters, running aeneas in parallel across CPU cores.
+
+    Alignment is CPU-bound and independent per chapter, so the DTW work
+    runs in a process pool while the driver applies each chapter's
+    database writes as its result arrives.
 
     Args:
         force: If True, realign all chapters
         start_chapter: Chapter to start from
     """
-    chapters = get_all_chapters()
+    chapters = [c for c in get_all_chapters() if c.chapter_id >= start_chapter]
 
     print(f"Aligning {len(chapters)} chapters...")
     print()
 
-    for chapter in chapters:
-        if chapter.chapter_id < start_chapter:
-            continue
-
-        print(f"Chapter {chapter.chapter_id}: {chapter.title}")
+    # One query answers "which chapters are done" instead of loading every
+    # chapter's sentences just to peek at the first row.
+    aligned = get_aligned_chapter_ids() if not force else set()
 
-        try:
-            alignment = align_chapter(chapter.chapter_id, force=force)
-            print(f"  Aligned {len(alignment.sentences)} sentences")
-        except FileNotFoundError as e:
-            print(f"  SKIPPED: {e}")
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            raise
-
-        print()
+    to_align: list[int] = []
+    for chapter in chapters:
+        if chapter.chapter_id in aligned:
+            print(f"Chapter {chapter.chapter_id}: already aligned, skipping")
+        else:
+            to_align.append(chapter.chapter_id)
+
+    if to_align:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {pool.submit(_compute_alignment, cid): cid for cid in to_align}
+            for future in as_completed(futures):
+                chapter_id = futures[future]
+                print(f"Chapter {chapter_id}:")
+                try:
+                    alignment = future.result()
+                except FileNotFoundError as e:
+                    print(f"  SKIPPED: {e}")
+                    continue
+                except Exception as e:
+                    print(f"  ERROR: {e}")
+                    raise
+                _store_alignment(alignment)
+                print(f"  Aligned {len(alignment.sentences)} sentences")
+                print()
 
     print("Alignment complete!")
 
 
 def validate_alignments() -> None:
     """Validate that all sentences have alignment data."""
-    chapters = get_all_chapters()
-    issues = []
-
-    for chapter in chapters:
-        sentences = get_chapter_sentences(chapter.chapter_id)
-        for sentence in sentences:
-            if sentence.start_time is None or sentence.end_time is None:
-                issues.append(
-                    f"Chapter {chapter.chapter_id}, sentence {sentence.sentence_id}: missing alignment"
-                )
-            elif sentence.start_time >= sentence.end_time:
-                issues.append(
-                    f"Chapter {chapter.chapter_id}, sentence {sentence.sentence_id}: invalid times"
-                )
+    # One SQL scan instead of a query (and model hydration) per chapter
+    issues = [
+        f"Chapter {chapter_id}, sentence {sentence_id}: "
+        + ("missing alignment" if missing else "invalid times")
+        for chapter_id, sentence_id, missing in find_alignment_issues()
+    ]
 
     if issues:
         print(f"Found {len(issues)} alignment issues:")
@@ -3,32 +3,63 @@
 This module generates one audio file per chapter using ElevenLabs TTS API.
 """
 
-import time
+import asyncio
+from functools import lru_cache
 from pathlib import Path
 
-from elevenlabs import ElevenLabs
-from mutagen.mp3 import MP3
+from elevenlabs import AsyncElevenLabs, ElevenLabs
 
 from bard.config import get_settings
 from bard.database import get_all_chapters, get_chapter_sentences, update_chapter_audio
 from bard.preprocessing.text_prep import load_prepared_text
+from bard.services.tts import get_elevenlabs_client
 
 
-def get_elevenlabs_client() -> ElevenLabs:
-    """Create ElevenLabs client with API key from settings."""
-    settings = get_settings()
-    if not settings.elevenlabs_api_key:
-        raise ValueError("ELEVENLABS_API_KEY not set in environment")
-    return ElevenLabs(api_key=settings.elevenlabs_api_key)
-
-
+@lru_cache(maxsize=32)
 def build_chapter_text(chapter_id: int) -> str:
     """Build the full text for a chapter by concatenating sentences.
 
     Sentences are joined with newlines to provide natural pauses in TTS.
+    Cached so a retried chapter does not redo the query and join.
     """
     sentences = get_chapter_sentences(chapter_id)
-    return "\n".join(s.text for s in sentences)
+    return "\n".join([s.text for s in sentences])
+
+
+def _prepare_chapter(chapter_id: int, force: bool) -> tuple[Path, str | None]:
+    """Resolve the output path and text for a chapter.
+
+    Returns (audio_path, chapter_text); the text is None when the audio
+    already exists and should be kept.
+    """
+    settings = get_settings()
+    audio_dir = settings.get_audio_path()
+    audio_dir.mkdir(parents=True, exist_ok=True)
+
+    audio_path = audio_dir / f"chapter_{chapter_id}.mp3"
+
+    # Skip if already exists (unless force)
+    if audio_path.exists() and not force:
+        print(f"  Audio already exists: {audio_path}")
+        return audio_path, None
+
+    if not settings.elevenlabs_voice_id:
+        raise ValueError("ELEVENLABS_VOICE_ID not set in environment")
+
+    chapter_text = build_chapter_text(chapter_id)
+    print(f"  Chapter {chapter_id}: {len(chapter_text)} characters")
+    return audio_path, chapter_text
+
+
+def _finalize_chapter(chapter_id: int, audio_path: Path) -> None:
+    """Record the written audio file's path and duration in the database."""
+    print(f"  Saved to {audio_path}")
+
+    duration = get_audio_duration(audio_path)
+    print(f"  Duration: {duration:.2f} seconds")
+
+    relative_path = f"audio/chapter_{chapter_id}.mp3"
+    update_chapter_audio(chapter_id, relative_path, duration)
 
 
 def generate_chapter_audio(
@@ -46,59 +77,129 @@ def generate_chapter_audio(
     Returns:
         Path to the generated audio file
     """
-    settings = get_settings()
-    audio_dir = settings.get_audio_path()
-    audio_dir.mkdir(parents=True, exist_ok=True)
-
-    audio_path = audio_dir / f"chapter_{chapter_id}.mp3"
-
-    # Skip if already exists (unless force)
-    if audio_path.exists() and not force:
-        print(f"  Audio already exists: {audio_path}")
+    audio_path, chapter_text = _prepare_chapter(chapter_id, force)
+    if chapter_text is None:
         return audio_path
 
     if client is None:
         client = get_elevenlabs_client()
 
-    if not settings.elevenlabs_voice_id:
-        raise ValueError("ELEVENLABS_VOICE_ID not set in environment")
+    settings = get_settings()
+    print(f"  Generating audio with voice {settings.elevenlabs_voice_id}...")
+    audio_generator = client.text_to_speech.convert(
+        voice_id=settings.elevenlabs_voice_id,
+        text=chapter_text,
+        model_id=settings.tts_model_id,
+        output_format=settings.tts_output_format,
+    )
 
-    # Build chapter text
-    chapter_text = build_chapter_text(chapter_id)
-    char_count = len(chapter_text)
-    print(f"  Chapter {chapter_id}: {char_count} characters")
+    # writelines drains the byte generator without a per-chunk Python loop
+    with open(audio_path, "wb") as f:
+        f.writelines(audio_generator)
 
-    # Generate audio using ElevenLabs
+    _finalize_chapter(chapter_id, audio_path)
+    return audio_path
+
+
+async def _generate_chapter_audio_async(
+    chapter_id: int,
+    client: AsyncElevenLabs,
+    force: bool = False,
+) -> Path:
+    """Async counterpart of generate_chapter_audio sharing one client."""
+    audio_path, chapter_text = _prepare_chapter(chapter_id, force)
+    if chapter_text is None:
+        return audio_path
+
+    settings = get_settings()
     print(f"  Generating audio with voice {settings.elevenlabs_voice_id}...")
-    audio_generator = client.text_to_speech.convert(
+    stream = client.text_to_speech.convert(
         voice_id=settings.elevenlabs_voice_id,
         text=chapter_text,
         model_id=settings.tts_model_id,
         output_format=settings.tts_output_format,
     )
 
-    # Write audio to file (generator yields bytes)
     with open(audio_path, "wb") as f:
-        for chunk in audio_generator:
+        async for chunk in stream:
             f.write(chunk)
 
-    print(f"  Saved to {audio_path}")
+    _finalize_chapter(chapter_id, audio_path)
+    return audio_path
 
-    # Get duration using mutagen
-    duration = get_audio_duration(audio_path)
-    print(f"  Duration: {duration:.2f} seconds")
 
-    # Update database with audio path and duration
-    relative_path = f"audio/chapter_{chapter_id}.mp3"
-    update_chapter_audio(chapter_id, relative_path, duration)
+# Layer III bitrate (kbps) and sample-rate tables, indexed by MPEG version
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
 
-    return audio_path
+
+def _parse_mp3_duration(head: bytes, file_size: int) -> float | None:
+    """Read duration from the first MPEG frame header in ``head``.
+
+    Uses the Xing/Info frame count when present (VBR), otherwise assumes
+    constant bitrate. Returns None when no valid frame header is found.
+    """
+    # Skip a leading ID3v2 tag (synchsafe 28-bit size at bytes 6..9)
+    pos = 0
+    if head[:3] == b"ID3" and len(head) >= 10:
+        size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+        pos = 10 + size
+
+    # Scan for the frame sync
+    while pos + 4 <= len(head):
+        if head[pos] == 0xFF and head[pos + 1] & 0xE0 == 0xE0:
+            break
+        pos += 1
+    else:
+        return None
+
+    version = (head[pos + 1] >> 3) & 3  # 3=MPEG1, 2=MPEG2, 0=MPEG2.5
+    layer = (head[pos + 1] >> 1) & 3  # 1=Layer III
+    bitrate_index = (head[pos + 2] >> 4) & 0xF
+    rate_index = (head[pos + 2] >> 2) & 3
+    mono = (head[pos + 3] >> 6) & 3 == 3
+
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    samples_per_frame = 1152 if version == 3 else 576
+
+    # A Xing/Info block sits after the side info; its frame count gives the
+    # exact duration for VBR files
+    if version == 3:
+        xing_pos = pos + 4 + (17 if mono else 32)
+    else:
+        xing_pos = pos + 4 + (9 if mono else 17)
+    if head[xing_pos : xing_pos + 4] in (b"Xing", b"Info") and len(head) >= xing_pos + 12:
+        flags = int.from_bytes(head[xing_pos + 4 : xing_pos + 8], "big")
+        if flags & 1:
+            frames = int.from_bytes(head[xing_pos + 8 : xing_pos + 12], "big")
+            return frames * samples_per_frame / sample_rate
+
+    # No VBR header: treat as CBR and estimate from the file size
+    bitrate = (_BITRATES_V1 if version == 3 else _BITRATES_V2)[bitrate_index] * 1000
+    return (file_size - pos) * 8 / bitrate
 
 
 def get_audio_duration(audio_path: Path) -> float:
-    """Get audio duration in seconds using mutagen."""
-    audio = MP3(audio_path)
-    return audio.info.length
+    """Get audio duration in seconds.
+
+    Reads only the first 4KB to parse the MPEG frame and Xing header
+    instead of letting mutagen scan the whole file; mutagen remains the
+    fallback for anything the fast path cannot parse.
+    """
+    with open(audio_path, "rb") as f:
+        head = f.read(4096)
+
+    duration = _parse_mp3_duration(head, audio_path.stat().st_size)
+    if duration is not None:
+        return duration
+
+    from mutagen.mp3 import MP3
+
+    return MP3(audio_path).info.length
 
 
 def generate_all_chapters(force: bool = False, start_chapter: int = 1) -> None:
@@ -121,36 +222,38 @@ def generate_all_chapters(force: bool = False, start_chapter: int = 1) -> None:
     if prepared is None:
         raise ValueError("No prepared text found. Run text_prep.py first.")
 
-    client = get_elevenlabs_client()
-    chapters = get_all_chapters()
+    chapters = [c for c in get_all_chapters() if c.chapter_id >= start_chapter]
 
     print(f"Generating audio for {len(chapters)} chapters...")
     print(f"Using voice: {settings.elevenlabs_voice_id}")
     print(f"Using model: {settings.tts_model_id}")
     print()
 
-    for chapter in chapters:
-        if chapter.chapter_id < start_chapter:
-            continue
-
-        print(f"Chapter {chapter.chapter_id}: {chapter.title}")
-
-        try:
-            generate_chapter_audio(chapter.chapter_id, client=client, force=force)
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            print("  Waiting 60 seconds before retry...")
-            time.sleep(60)
-            try:
-                generate_chapter_audio(chapter.chapter_id, client=client, force=force)
-            except Exception as e2:
-                print(f"  FAILED: {e2}")
-                raise
-
-        # Rate limiting: ElevenLabs has limits, add small delay between chapters
-        print("  Waiting 2 seconds (rate limiting)...")
-        time.sleep(2)
-        print()
+    async def _run() -> None:
+        client = AsyncElevenLabs(api_key=settings.elevenlabs_api_key)
+        # Two chapters in flight keeps within the ElevenLabs concurrency
+        # limit while chapter N+1 downloads as chapter N finishes writing,
+        # replacing the old fixed 2-second sleep between chapters.
+        semaphore = asyncio.Semaphore(2)
+
+        async def _one(chapter_id: int, title: str) -> None:
+            async with semaphore:
+                print(f"Chapter {chapter_id}: {title}")
+                try:
+                    await _generate_chapter_audio_async(chapter_id, client, force=force)
+                except Exception as e:
+                    print(f"  ERROR: {e}")
+                    print("  Waiting 60 seconds before retry...")
+                    await asyncio.sleep(60)
+                    try:
+                        await _generate_chapter_audio_async(chapter_id, client, force=force)
+                    except Exception as e2:
+                        print(f"  FAILED: {e2}")
+                        raise
+
+        await asyncio.gather(*(_one(c.chapter_id, c.title) for c in chapters))
+
+    asyncio.run(_run())
 
     print("Audio generation complete!")
 
@@ -0,0 +1,58 @@
+"""Persistent answer cache for the Ask Bard feature.
+
+Listeners re-ask the same questions at the same points in the book, often
+across sessions. Answers are cached in SQLite keyed by a fingerprint of
+(context, normalized question), so a repeat skips both the LLM round-trip
+and the TTS synthesis and restarts keep the cache warm. Matching is
+exact after normalization; embedding-based semantic matching would need
+a vector index this project otherwise has no use for.
+"""
+
+import hashlib
+import re
+
+from bard.database import get_cached_answer, store_cached_answer
+from bard.services.tts import get_answer_audio_path
+
+_WS_RE = re.compile(r"\s+")
+
+
+def answer_cache_key(context: str, question: str) -> str:
+    """Build the cache key for a question asked against a given context.
+
+    The question is lowercased, whitespace-collapsed, and stripped of
+    trailing punctuation so trivial rephrasings ("Who is Zacchaeus?",
+    "who is zacchaeus") share an entry. The full context is hashed in,
+    which scopes the answer to the exact narrative position and keeps
+    spoiler boundaries intact.
+    """
+    normalized = _WS_RE.sub(" ", question.strip().lower()).rstrip(" ?!.")
+    digest = hashlib.sha256()
+    digest.update(context.encode())
+    digest.update(b"\x00")
+    digest.update(normalized.encode())
+    return digest.hexdigest()
+
+
+def get_answer(cache_key: str) -> tuple[str, str | None] | None:
+    """Fetch a cached (answer_text, audio_url), or None on a miss.
+
+    The audio URL is dropped if the mp3 it points at no longer exists on
+    disk, so callers never hand out dead links.
+    """
+    cached = get_cached_answer(cache_key)
+    if cached is None:
+        return None
+
+    answer_text, audio_url = cached
+    if audio_url is not None:
+        # audio_url has the form "/answers/{answer_id}/audio"
+        answer_id = audio_url.split("/")[2]
+        if get_answer_audio_path(answer_id) is None:
+            audio_url = None
+    return answer_text, audio_url
+
+
+def put_answer(cache_key: str, answer_text: str, audio_url: str | None) -> None:
+    """Store a freshly generated answer for future repeats."""
+    store_cached_answer(cache_key, answer_text, audio_url)
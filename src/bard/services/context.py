@@ -5,13 +5,30 @@ playback position. It includes all sentences up to and including the current
 sentence being spoken.
 """
 
+import io
+from functools import lru_cache
+
 import tiktoken
 
 from bard.config import get_settings
-from bard.database import find_sentence_at_time, get_context_sentences
+from bard.database import (
+    build_context_rows,
+    find_sentence_at_time,
+    get_context_snapshot,
+    store_context_snapshot,
+)
 from bard.models import Sentence
 
 
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Load the tokenizer once; construction re-reads the registry."""
+    try:
+        return tiktoken.encoding_for_model("gpt-4o")
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def resolve_current_sentence(chapter_id: int, audio_time: float) -> Sentence:
     """Resolve the current sentence from playback position.
 
@@ -46,35 +63,105 @@ def build_context(current_sentence_id: int, max_tokens: int | None = None) -> st
     Returns:
         Formatted context string with all relevant text
     """
+    context, _ = build_context_with_stats(current_sentence_id, max_tokens)
+    return context
+
+
+def build_context_with_stats(
+    current_sentence_id: int, max_tokens: int | None = None
+) -> tuple[str, dict]:
+    """Build the narrative context and its statistics in one pass.
+
+    Fetching and tokenizing once serves both the LLM prompt and the stats
+    reported alongside it, instead of each caller re-reading and
+    re-encoding the same sentences.
+
+    Returns:
+        (context, stats) where stats holds sentence_count, chapter_count,
+        and estimated_tokens for the included context
+    """
     settings = get_settings()
+    # Snapshots only apply to the default budget; a caller-supplied limit
+    # changes the assembled text
+    use_snapshot = max_tokens is None
     if max_tokens is None:
         max_tokens = settings.max_context_tokens
 
-    # Get all sentences up to current
-    sentences = get_context_sentences(current_sentence_id)
+    if use_snapshot:
+        snapshot = get_context_snapshot(current_sentence_id)
+        if snapshot is not None:
+            return snapshot
+
+    # One JOIN brings back the sentences with their chapter title, so the
+    # assembler never issues a second query for chapter metadata. Every
+    # kept sentence costs at least two budget tokens (one of text plus
+    # the joiner), so max_tokens rows over-fetches safely: rows the trim
+    # below could never keep stay inside SQLite.
+    rows = build_context_rows(current_sentence_id, limit=max_tokens or None)
 
-    if not sentences:
-        return ""
+    if not rows:
+        return "", {"sentence_count": 0, "chapter_count": 0, "estimated_tokens": 0}
 
-    # Build context text
-    context_parts: list[str] = []
+    sentence_count = len(rows)
+    chapter_count = len({chapter_id for chapter_id, _, _ in rows})
+
+    # Trim before formatting: tokenizing newest-first and stopping at the
+    # budget touches O(max_tokens) text, instead of encoding the whole
+    # narrative only to discard most of it
+    if max_tokens:
+        rows, token_count = _newest_rows_within(rows, max_tokens)
+    else:
+        encoding = _get_encoding()
+        token_count = sum(len(encoding.encode_ordinary(text)) + 1 for _, _, text in rows)
+
+    # Assemble into a single growable buffer; StringIO amortizes its
+    # reallocations where repeated += would recopy the whole prefix
+    buffer = io.StringIO()
+    write = buffer.write
     current_chapter = None
 
-    for sentence in sentences:
+    for chapter_id, title, text in rows:
         # Add chapter header when chapter changes
-        if sentence.chapter_id != current_chapter:
-            current_chapter = sentence.chapter_id
-            context_parts.append(f"\n--- Chapter {current_chapter} ---\n")
+        if chapter_id != current_chapter:
+            current_chapter = chapter_id
+            write(f" \n--- {title} ---\n ")
+        else:
+            write(" ")
+        write(text)
+
+    stats = {
+        "sentence_count": sentence_count,
+        "chapter_count": chapter_count,
+        "estimated_tokens": token_count,
+    }
+    context = buffer.getvalue().strip()
+    if use_snapshot and context:
+        store_context_snapshot(current_sentence_id, context, stats)
+    return context, stats
 
-        context_parts.append(sentence.text)
 
-    context = " ".join(context_parts)
+def _newest_rows_within(
+    rows: list[tuple[int, str, str]], max_tokens: int
+) -> tuple[list[tuple[int, str, str]], int]:
+    """Return the longest suffix of context rows fitting the token budget.
 
-    # Truncate if needed (from the beginning to keep recent context)
-    if max_tokens:
-        context = truncate_to_tokens(context, max_tokens)
+    Scans from newest to oldest so only the kept sentences (plus one) are
+    ever tokenized. Always keeps at least the current sentence. Returns
+    the suffix and its token count.
+    """
+    encoding = _get_encoding()
+    total = 0
+    start = 0
 
-    return context.strip()
+    for i in range(len(rows) - 1, -1, -1):
+        # +1 approximates the joining space between sentences
+        count = len(encoding.encode_ordinary(rows[i][2])) + 1
+        if total + count > max_tokens and i < len(rows) - 1:
+            start = i + 1
+            break
+        total += count
+
+    return rows[start:], total
 
 
 def truncate_to_tokens(text: str, max_tokens: int) -> str:
@@ -82,12 +169,9 @@ def truncate_to_tokens(text: str, max_tokens: int) -> str:
 
     Uses tiktoken for accurate token counting.
     """
-    try:
-        encoding = tiktoken.encoding_for_model("gpt-4o")
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    tokens = encoding.encode(text)
+    encoding = _get_encoding()
+    # encode_ordinary skips special-token scanning; the narrative is plain text
+    tokens = encoding.encode_ordinary(text)
 
     if len(tokens) <= max_tokens:
         return text
@@ -118,23 +202,5 @@ def get_context_stats(current_sentence_id: int) -> dict:
     Returns:
         Dict with sentence_count, chapter_count, estimated_tokens
     """
-    sentences = get_context_sentences(current_sentence_id)
-
-    if not sentences:
-        return {"sentence_count": 0, "chapter_count": 0, "estimated_tokens": 0}
-
-    chapters = set(s.chapter_id for s in sentences)
-    total_text = " ".join(s.text for s in sentences)
-
-    try:
-        encoding = tiktoken.encoding_for_model("gpt-4o")
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    token_count = len(encoding.encode(total_text))
-
-    return {
-        "sentence_count": len(sentences),
-        "chapter_count": len(chapters),
-        "estimated_tokens": token_count,
-    }
+    _, stats = build_context_with_stats(current_sentence_id)
+    return stats
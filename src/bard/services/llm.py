@@ -4,9 +4,110 @@ This module handles generating answers to user questions using GPT-5 models
 with the new Responses API for optimal performance with reasoning models.
 """
 
-from openai import AsyncOpenAI
+import asyncio
+import hashlib
+import random
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, RateLimitError
+
+from bard.config import settings
+
+# Cap concurrent OpenAI requests: past the account's tier, extra fan-out
+# just converts into 429s whose backoff slows everyone down.
+_llm_semaphore = asyncio.Semaphore(settings.openai_max_concurrency)
+
+_MAX_RETRIES = 3
+
+
+@lru_cache(maxsize=1)
+def _client() -> AsyncOpenAI:
+    """Get the shared OpenAI client, created on first use.
+
+    A per-call AsyncOpenAI builds a fresh connection pool, paying a full
+    TLS handshake to api.openai.com on every question. One cached client
+    keeps the connections alive across requests.
+    """
+    if not settings.openai_api_key:
+        raise ValueError("OPENAI_API_KEY not set in environment")
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.openai_max_keepalive,
+                max_connections=settings.openai_max_connections,
+            ),
+            timeout=httpx.Timeout(60.0),
+        ),
+    )
+
+
+async def warmup_llm() -> None:
+    """Open a connection to the OpenAI API before the first question.
+
+    A models.list() round-trip pays the DNS/TCP/TLS setup at startup so
+    the first listener's time-to-first-token doesn't include it. Failures
+    are logged, not raised: warmup is an optimization, not a dependency.
+    """
+    try:
+        await _client().models.list()
+    except Exception as e:
+        print(f"Warning: LLM warmup failed: {e}")
+
+
+async def aclose_client() -> None:
+    """Close the shared client's connections at shutdown, if one was made."""
+    if _client.cache_info().currsize:
+        await _client().close()
+
+
+# Prompt layout note: the constant instructions come first and the narrative
+# context precedes the volatile question inside the input, so successive
+# questions in the same chapter share the longest possible prompt prefix.
+# prompt_cache_key routes requests with that shared prefix to the same
+# server-side cache, skipping re-encoding of the unchanged tokens.
+
+
+def _prompt_cache_key(context: str) -> str:
+    """Cache-routing key for calls sharing the same narrative context.
+
+    Keying on the context fingerprint (rather than one static key for
+    the whole service) sends listeners paused at the same position to
+    the same server-side cache shard, where their shared prefix is
+    already encoded.
+    """
+    return "bard-" + hashlib.sha256(context.encode()).hexdigest()[:16]
+
+
+async def _create_response(**kwargs):
+    """Issue responses.create under the concurrency cap.
+
+    Rate-limit errors back off exponentially with jitter before retrying;
+    anything else propagates to the caller's error handling.
+    """
+    client = _client()
+    async with _llm_semaphore:
+        for attempt in range(_MAX_RETRIES):
+            try:
+                return await client.responses.create(**kwargs)
+            except RateLimitError:
+                if attempt == _MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(2**attempt + random.random())
+
+
+# Fixed halves of the user input. str.join over prebuilt parts sizes the
+# result once from the summed lengths, instead of re-copying the
+# multi-kilobyte context through f-string concatenation on every request.
+_TMPL_HEAD = "NARRATIVE CONTEXT (everything the listener has heard so far):\n"
+_TMPL_TAIL = "\n\n---\n\nLISTENER'S QUESTION: "
+
+
+def _build_user_input(context: str, question: str) -> str:
+    """Assemble the user input from the precompiled template parts."""
+    return "".join((_TMPL_HEAD, context, _TMPL_TAIL, question))
 
-from bard.config import get_settings
 
 # Instructions for the narrator (replaces system prompt in Responses API)
 NARRATOR_INSTRUCTIONS = """You are Bard, the narrator of this audiobook.
@@ -35,27 +136,16 @@ async def generate_answer(context: str, question: str) -> str:
     Returns:
         The generated answer text
     """
-    settings = get_settings()
-
-    if not settings.openai_api_key:
-        raise ValueError("OPENAI_API_KEY not set in environment")
-
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
-
     # Build the user input with context
-    user_input = f"""NARRATIVE CONTEXT (everything the listener has heard so far):
-{context}
-
----
-
-LISTENER'S QUESTION: {question}"""
+    user_input = _build_user_input(context, question)
 
     # Use the new Responses API with reasoning effort set to none
-    response = await client.responses.create(
+    response = await _create_response(
         model=settings.openai_model,
         instructions=NARRATOR_INSTRUCTIONS,
         input=user_input,
         reasoning={"effort": "minimal"},  # Minimal reasoning for low latency
+        prompt_cache_key=_prompt_cache_key(context),
     )
 
     # Get the output text from the response
@@ -71,26 +161,15 @@ async def generate_answer_streaming(context: str, question: str):
 
     Yields text chunks as they're generated.
     """
-    settings = get_settings()
-
-    if not settings.openai_api_key:
-        raise ValueError("OPENAI_API_KEY not set in environment")
-
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
-
-    user_input = f"""NARRATIVE CONTEXT (everything the listener has heard so far):
-{context}
-
----
-
-LISTENER'S QUESTION: {question}"""
+    user_input = _build_user_input(context, question)
 
     # Use streaming with the Responses API
-    stream = await client.responses.create(
+    stream = await _create_response(
         model=settings.openai_model,
         instructions=NARRATOR_INSTRUCTIONS,
         input=user_input,
         reasoning={"effort": "minimal"},  # Minimal reasoning for low latency
+        prompt_cache_key=_prompt_cache_key(context),
         stream=True,
     )
 
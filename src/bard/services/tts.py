@@ -4,81 +4,186 @@ This module uses ElevenLabs to synthesize answer audio using the same
 voice as the audiobook narration.
 """
 
+import asyncio
+import os
+import queue
+import re
 import uuid
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
+import httpx
 from elevenlabs import ElevenLabs
 
-from bard.config import get_settings
+from bard.config import settings
+from bard.services.llm import generate_answer_streaming
 
+# Cap concurrent syntheses so a burst of questions queues briefly here
+# instead of tripping ElevenLabs' concurrent-request limit.
+_tts_semaphore = asyncio.Semaphore(settings.tts_max_concurrency)
 
+
+@lru_cache(maxsize=1)
 def get_elevenlabs_client() -> ElevenLabs:
-    """Create ElevenLabs client with API key from settings."""
-    settings = get_settings()
+    """Get the shared ElevenLabs client, created on first use.
+
+    Mirrors the OpenAI client reuse: a per-call client discards its httpx
+    pool, re-handshaking TLS for every synthesis. One cached client with
+    explicit keep-alive limits holds the connections open.
+    """
     if not settings.elevenlabs_api_key:
         raise ValueError("ELEVENLABS_API_KEY not set in environment")
-    return ElevenLabs(api_key=settings.elevenlabs_api_key)
+    return ElevenLabs(
+        api_key=settings.elevenlabs_api_key,
+        httpx_client=httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=32), timeout=240
+        ),
+    )
+
+
+def prepare_answers_dir() -> Path:
+    """Ensure the answers directory exists and return it.
+
+    Safe to call speculatively: callers overlap this with the LLM call so
+    the mkdir/stat syscalls are off the critical path by the time
+    synthesis needs the directory.
+    """
+    answers_dir = settings.get_data_path() / "answers"
+    answers_dir.mkdir(parents=True, exist_ok=True)
+    return answers_dir
+
+
+async def warmup_tts() -> None:
+    """Open a connection to the ElevenLabs API before the first answer.
+
+    Uses the free models listing so the TLS handshake happens at startup
+    instead of inside the first synthesis. Failures are logged, not
+    raised.
+    """
+    try:
+        await asyncio.to_thread(lambda: get_elevenlabs_client().models.list())
+    except Exception as e:
+        print(f"Warning: TTS warmup failed: {e}")
 
 
-async def synthesize_answer(answer_text: str) -> str:
-    """Synthesize answer text to audio using ElevenLabs streaming API.
+async def synthesize_answer(answer_text: str, *, stream: bool = True) -> str:
+    """Synthesize answer text to audio and save it for playback.
 
-    Uses the streaming endpoint for faster time-to-first-byte,
-    then saves to file for playback.
+    Defaults to the streaming endpoint for faster time-to-first-byte;
+    pass ``stream=False`` to use the plain convert endpoint instead.
 
     Args:
         answer_text: The text answer to synthesize
+        stream: Use the streaming endpoint (default) or the sync convert one
 
     Returns:
         URL path to the generated audio file (relative to API)
     """
-    settings = get_settings()
-
     if not settings.elevenlabs_voice_id:
         raise ValueError("ELEVENLABS_VOICE_ID not set in environment")
 
     client = get_elevenlabs_client()
+    synthesize = client.text_to_speech.stream if stream else client.text_to_speech.convert
 
-    # Generate unique filename for this answer
+    # Generate unique filename for this answer, sharded by id prefix so
+    # no single directory accumulates thousands of entries (flat dirs
+    # make readdir/stat progressively slower on most filesystems)
     answer_id = str(uuid.uuid4())[:8]
-    answers_dir = settings.get_data_path() / "answers"
-    answers_dir.mkdir(parents=True, exist_ok=True)
-    audio_path = answers_dir / f"answer_{answer_id}.mp3"
+    shard_dir = prepare_answers_dir() / answer_id[:2]
+    shard_dir.mkdir(exist_ok=True)
+    audio_path = shard_dir / f"answer_{answer_id}.mp3"
 
-    # Use streaming endpoint for lower latency
-    audio_stream = client.text_to_speech.stream(
+    audio_stream = synthesize(
         voice_id=settings.elevenlabs_voice_id,
         text=answer_text,
         model_id=settings.tts_model_id,
         output_format=settings.tts_output_format,
     )
 
-    # Write chunks to file as they arrive
-    with open(audio_path, "wb") as f:
-        for chunk in audio_stream:
-            f.write(chunk)
+    # The SDK stream is a sync generator; pumping it here would block the
+    # event loop for the whole synthesis, so it runs in a worker thread
+    async with _tts_semaphore:
+        await asyncio.to_thread(_write_stream, audio_stream, audio_path)
 
     # Return URL path for the API to serve
     return f"/answers/{answer_id}/audio"
 
 
+def _write_stream(audio_stream, audio_path: Path) -> None:
+    """Drain a synchronous audio byte stream to disk.
+
+    A 64 KiB buffer batches the SDK's small chunks into fewer syscalls.
+    Answer files are written once and read back at most a handful of
+    times, so after flushing the dirty pages we tell the kernel not to
+    retain them — that RAM is better spent on the SQLite page cache and
+    the chapter audio that every listener streams.
+    """
+    with open(audio_path, "wb", buffering=65536) as f:
+        f.writelines(audio_stream)
+        if hasattr(os, "posix_fadvise"):
+            f.flush()
+            os.fsync(f.fileno())
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
 def get_answer_audio_path(answer_id: str) -> Path | None:
     """Get the path to an answer audio file."""
-    settings = get_settings()
-    audio_path = settings.get_data_path() / "answers" / f"answer_{answer_id}.mp3"
+    answers_dir = settings.get_data_path() / "answers"
+    audio_path = answers_dir / answer_id[:2] / f"answer_{answer_id}.mp3"
     if audio_path.exists():
         return audio_path
+    # Files written before the directory was sharded live at the top level
+    legacy_path = answers_dir / f"answer_{answer_id}.mp3"
+    if legacy_path.exists():
+        return legacy_path
     return None
 
 
+async def _aiter_blocking(stream):
+    """Iterate a sync byte stream from async code, one chunk per thread hop."""
+    chunks = iter(stream)
+    sentinel = object()
+    while (chunk := await asyncio.to_thread(next, chunks, sentinel)) is not sentinel:
+        yield chunk
+
+
+async def _batched(chunks, first_size: int = 2048, max_size: int = 16384):
+    """Coalesce small audio chunks before they hit the response stream.
+
+    Each yielded chunk becomes a kernel write and an HTTP frame, so
+    forwarding the SDK's small chunks one-to-one wastes most of the
+    bandwidth on framing. The batch target starts small to keep
+    time-to-first-byte low, then grows geometrically to max_size for
+    steady-state throughput.
+    """
+    buffer = bytearray()
+    target = first_size
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= target:
+            yield bytes(buffer)
+            buffer.clear()
+            target = min(target * 4, max_size)
+    if buffer:
+        yield bytes(buffer)
+
+
+def pcm_media_type() -> str:
+    """Content type for the live PCM stream, e.g. audio/l16;rate=24000."""
+    rate = settings.tts_stream_format.rsplit("_", 1)[-1]
+    return f"audio/l16;rate={rate}"
+
+
 async def synthesize_answer_streaming(answer_text: str):
     """Synthesize answer with streaming audio output.
 
-    Yields audio chunks as they're generated - useful for
-    streaming directly to client without saving to file.
+    Yields raw PCM chunks (tts_stream_format) as they arrive from
+    ElevenLabs. Unlike the mp3 path there is no container to finalize,
+    so the first audible bytes can be forwarded immediately. The SDK
+    stream is a sync generator, so each chunk is pulled in a worker
+    thread to keep the event loop free.
     """
-    settings = get_settings()
-
     if not settings.elevenlabs_voice_id:
         raise ValueError("ELEVENLABS_VOICE_ID not set in environment")
 
@@ -89,8 +194,90 @@ async def synthesize_answer_streaming(answer_text: str):
         voice_id=settings.elevenlabs_voice_id,
         text=answer_text,
         model_id=settings.tts_model_id,
-        output_format=settings.tts_output_format,
+        output_format=settings.tts_stream_format,
     )
 
-    for chunk in audio_stream:
-        yield chunk
+    async with _tts_semaphore:
+        async for batch in _batched(_aiter_blocking(audio_stream)):
+            yield batch
+
+
+# A sentence is complete at terminal punctuation followed by whitespace;
+# that's the granularity ElevenLabs needs for natural prosody.
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+async def speak_answer_streaming(context: str, question: str):
+    """Speak an answer while the LLM is still generating it.
+
+    The serial path waits for the full answer text before any synthesis
+    starts, stacking the two latencies. Here the LLM's text deltas are
+    buffered to sentence boundaries and fed into ElevenLabs' realtime
+    input stream, so the first sentence is being spoken while the model
+    writes the rest. Yields PCM chunks (tts_stream_format).
+    """
+    if not settings.elevenlabs_voice_id:
+        raise ValueError("ELEVENLABS_VOICE_ID not set in environment")
+
+    client = get_elevenlabs_client()
+    loop = asyncio.get_running_loop()
+
+    # Bridge between the async LLM stream and the sync SDK: completed
+    # sentences flow to the synthesis thread, audio chunks flow back.
+    sentences: queue.Queue[str | None] = queue.Queue()
+    audio: asyncio.Queue[bytes | Exception | None] = asyncio.Queue()
+
+    async def _feed() -> None:
+        buffer = ""
+        try:
+            async for delta in generate_answer_streaming(context, question):
+                buffer += delta
+                parts = _SENTENCE_BOUNDARY_RE.split(buffer)
+                for sentence in parts[:-1]:
+                    if sentence:
+                        sentences.put(sentence + " ")
+                buffer = parts[-1]
+        finally:
+            if buffer.strip():
+                sentences.put(buffer)
+            sentences.put(None)
+
+    def _speak() -> None:
+        def _text_stream():
+            while (piece := sentences.get()) is not None:
+                yield piece
+
+        try:
+            stream = client.text_to_speech.convert_realtime(
+                voice_id=settings.elevenlabs_voice_id,
+                text=_text_stream(),
+                model_id=settings.tts_model_id,
+                output_format=settings.tts_stream_format,
+            )
+            for chunk in stream:
+                loop.call_soon_threadsafe(audio.put_nowait, chunk)
+        except Exception as e:
+            loop.call_soon_threadsafe(audio.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(audio.put_nowait, None)
+
+    async def _drain():
+        while (chunk := await audio.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    async with _tts_semaphore:
+        feeder = asyncio.create_task(_feed())
+        speaker = asyncio.create_task(asyncio.to_thread(_speak))
+
+        try:
+            async for batch in _batched(_drain()):
+                yield batch
+        finally:
+            feeder.cancel()
+            with suppress(asyncio.CancelledError):
+                await feeder
+            # Unblock the synthesis thread if it's still waiting on text
+            sentences.put(None)
+            await speaker
@@ -125,6 +125,18 @@ class TestSentenceOperations:
         assert retrieved[1].sequence == 1
 
 
+class TestConnectionSetup:
+    """Tests for the per-connection PRAGMA configuration."""
+
+    def test_connection_uses_wal(self):
+        """Ingest relies on WAL so readers proceed during batch writes."""
+        from bard.database import get_connection
+
+        with get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+
 class TestAlignmentQueries:
     """Tests for alignment-related queries."""
 
@@ -173,6 +185,25 @@ class TestAlignmentQueries:
         # Could be either sentence at boundary
         assert sentence.sentence_id in [1, 2]
 
+    def test_find_sentence_at_time_uses_covering_index(self):
+        """The pause-resume lookup must stay a single covering-index seek."""
+        from bard.database import get_connection
+
+        with get_connection() as conn:
+            plan = conn.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT * FROM sentences
+                WHERE chapter_id = ? AND start_time <= ?
+                ORDER BY start_time DESC
+                LIMIT 1
+                """,
+                (1, 1.0),
+            ).fetchall()
+
+        detail = " ".join(row["detail"] for row in plan)
+        assert "COVERING INDEX idx_sent_time_cover" in detail
+
     def test_get_context_sentences(self):
         """Test getting context sentences up to a point."""
         insert_chapter(Chapter(chapter_id=1, title="Chapter 1"))
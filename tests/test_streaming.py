@@ -0,0 +1,55 @@
+"""Tests for the range-aware file streaming helpers."""
+
+from bard.api.streaming import _parse_range
+
+
+class TestParseRange:
+    """Tests for _parse_range header parsing and clamping."""
+
+    def test_first_byte(self):
+        """A single-byte range at the start of the file."""
+        assert _parse_range("bytes=0-0", 1000) == (0, 0)
+
+    def test_explicit_range(self):
+        """An explicit start-end range within the file."""
+        assert _parse_range("bytes=100-199", 1000) == (100, 199)
+
+    def test_open_ended(self):
+        """An open-ended range runs to the last byte."""
+        assert _parse_range("bytes=500-", 1000) == (500, 999)
+
+    def test_suffix_range(self):
+        """A suffix range returns the last N bytes."""
+        assert _parse_range("bytes=-100", 1000) == (900, 999)
+
+    def test_suffix_longer_than_file(self):
+        """A suffix longer than the file clamps to the whole file."""
+        assert _parse_range("bytes=-5000", 1000) == (0, 999)
+
+    def test_end_clamped_to_file(self):
+        """An end past the last byte clamps to the file size."""
+        assert _parse_range("bytes=0-5000", 1000) == (0, 999)
+
+    def test_multi_range_uses_first(self):
+        """Only the first spec of a multi-range header is served."""
+        assert _parse_range("bytes=0-99,200-299", 1000) == (0, 99)
+
+    def test_start_past_end_of_file(self):
+        """A start at or beyond the file size is unsatisfiable."""
+        assert _parse_range("bytes=1000-", 1000) is None
+        assert _parse_range("bytes=2000-3000", 1000) is None
+
+    def test_inverted_range(self):
+        """A start greater than its end is unsatisfiable."""
+        assert _parse_range("bytes=50-10", 1000) is None
+
+    def test_missing_unit_prefix(self):
+        """Headers without the bytes= prefix are rejected."""
+        assert _parse_range("0-100", 1000) is None
+        assert _parse_range("items=0-100", 1000) is None
+
+    def test_malformed_specs(self):
+        """Non-numeric or empty specs are rejected."""
+        assert _parse_range("bytes=abc-def", 1000) is None
+        assert _parse_range("bytes=-", 1000) is None
+        assert _parse_range("bytes=", 1000) is None
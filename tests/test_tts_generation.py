@@ -0,0 +1,62 @@
+"""Tests for the lightweight MP3 duration parser."""
+
+from bard.preprocessing.tts_generation import _parse_mp3_duration
+
+
+def _xing_block(frames: int) -> bytes:
+    """A Xing block advertising ``frames`` frames (FRAMES flag set)."""
+    return b"Xing" + (1).to_bytes(4, "big") + frames.to_bytes(4, "big")
+
+
+class TestParseMp3Duration:
+    """Tests for _parse_mp3_duration frame-header decoding."""
+
+    # MPEG1 Layer III, 128 kbps, 44100 Hz
+    MPEG1_STEREO = bytes([0xFF, 0xFB, 0x90, 0x00])
+    MPEG1_MONO = bytes([0xFF, 0xFB, 0x90, 0xC0])
+    # MPEG2 Layer III, 80 kbps, 22050 Hz
+    MPEG2_MONO = bytes([0xFF, 0xF3, 0x90, 0xC0])
+
+    def test_cbr_estimate(self):
+        """Without a Xing block, duration comes from size and bitrate."""
+        head = self.MPEG1_STEREO + b"\x00" * 100
+        # 160000 bytes at 128 kbps is exactly 10 seconds
+        assert _parse_mp3_duration(head, 160000) == 10.0
+
+    def test_xing_frame_count_stereo(self):
+        """A Xing block after the stereo side info gives the exact duration."""
+        head = self.MPEG1_STEREO + b"\x00" * 32 + _xing_block(1000)
+        duration = _parse_mp3_duration(head, 999999)
+        assert duration == 1000 * 1152 / 44100
+
+    def test_xing_frame_count_mono(self):
+        """Mono MPEG1 side info is 17 bytes, not 32."""
+        head = self.MPEG1_MONO + b"\x00" * 17 + _xing_block(1000)
+        duration = _parse_mp3_duration(head, 999999)
+        assert duration == 1000 * 1152 / 44100
+
+    def test_mpeg2_xing(self):
+        """MPEG2 halves the samples per frame and shifts the Xing offset."""
+        head = self.MPEG2_MONO + b"\x00" * 9 + _xing_block(2000)
+        duration = _parse_mp3_duration(head, 999999)
+        assert duration == 2000 * 576 / 22050
+
+    def test_skips_id3v2_tag(self):
+        """A leading ID3v2 tag (synchsafe size) is skipped before the sync scan."""
+        tag = b"ID3" + bytes([3, 0, 0]) + bytes([0, 0, 0, 20]) + b"\x00" * 20
+        head = tag + self.MPEG1_STEREO + b"\x00" * 100
+        # The tag bytes don't count toward the CBR size estimate
+        assert _parse_mp3_duration(head, len(tag) + 160000) == 10.0
+
+    def test_no_frame_sync_returns_none(self):
+        """Data without a frame sync falls through to the mutagen path."""
+        assert _parse_mp3_duration(b"\x00" * 100, 100) is None
+
+    def test_free_bitrate_returns_none(self):
+        """A free-format bitrate index can't be estimated from file size."""
+        head = bytes([0xFF, 0xFB, 0x00, 0x00]) + b"\x00" * 100
+        assert _parse_mp3_duration(head, 160000) is None
+
+    def test_truncated_head_returns_none(self):
+        """A buffer too short to hold a frame header is rejected."""
+        assert _parse_mp3_duration(b"\xff\xfb", 160000) is None